@@ -6,6 +6,8 @@
 # You should have received a copy of the GNU Lesser General Public License along with Quantus. If not, see <https://www.gnu.org/licenses/>.
 # Quantus project URL: <https://github.com/understandable-machine-intelligence-lab/Quantus>.
 
+from typing import Literal, Union, overload
+
 import scipy
 import numpy as np
 
@@ -40,9 +42,23 @@ def entropy(a: np.array, x: np.array, **kwargs) -> float:
     return scipy.stats.entropy(pk=a_normalised)
 
 
-def gini_coeffiient(a: np.array, x: np.array, **kwargs) -> float:
+@overload
+def gini_coeffiient(
+    a: np.array, x: np.array, batched: Literal[False] = False, **kwargs
+) -> float: ...
+
+
+@overload
+def gini_coeffiient(
+    a: np.array, x: np.array, batched: Literal[True], **kwargs
+) -> np.ndarray: ...
+
+
+def gini_coeffiient(
+    a: np.array, x: np.array, batched: bool = False, **kwargs
+) -> Union[float, np.ndarray]:
     """
-    Calculate Gini coefficient of a single array.
+    Calculate Gini coefficient of a single array (or a batch of arrays).
 
     Parameters
     ----------
@@ -50,15 +66,26 @@ def gini_coeffiient(a: np.array, x: np.array, **kwargs) -> float:
         Array to calculate gini_coeffiient on.
     x: np.ndarray
         Array to compute shape.
+    batched: bool
+        True if arrays are batched. Arrays are expected to be 2D (B x F), where B is batch size and F is the
+        number of features.
     kwargs: optional
         Keyword arguments.
 
     Returns
     -------
-    float:
-        A floating point, ranging [0, 1].
+    Union[float, np.ndarray]:
+        A floating point (or a batch of floating points), ranging [0, 1].
 
     """
+    if batched:
+        assert len(a.shape) == 2, "Batched arrays must be 2D"
+        n_features = a.shape[1]
+        a = np.sort(a.astype(np.float64) + 0.0000001, axis=1)
+
+        # The sorted values are weighted by their rank, the dot product fuses the product and the sum.
+        weights = 2 * np.arange(1, n_features + 1, dtype=np.float64) - n_features - 1
+        return (a @ weights) / (n_features * a.sum(axis=1))
 
     if len(x.shape) == 1:
         newshape = np.prod(x.shape)
@@ -102,3 +129,9 @@ def discrete_entropy(a: np.array, x: np.array, **kwargs) -> float:
     histogram, bins = np.histogram(a, bins=n_bins)
 
     return scipy.stats.entropy(pk=histogram)
+
+
+# Complexity functions whose score does not change when the attributions are multiplied by a
+# positive constant. Note that gini_coeffiient is not included, since its stabilising epsilon
+# makes the score depend on the magnitude of the attributions.
+SCALE_INVARIANT_COMPLEXITY_FUNCS = (entropy, discrete_entropy)
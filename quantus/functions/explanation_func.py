@@ -24,10 +24,14 @@ from quantus.helpers.utils import (
     get_wrapped_model,
 )
 
+# Look up the optional explanation libraries once, since explain is called for every batch.
+_CAPTUM_AVAILABLE = util.find_spec("captum") is not None
+_ZENNIT_AVAILABLE = util.find_spec("zennit") is not None
+_TF_EXPLAIN_AVAILABLE = util.find_spec("tf_explain") is not None
 
 if util.find_spec("torch"):
     import torch
-if util.find_spec("captum"):
+if _CAPTUM_AVAILABLE:
     from captum.attr import (
         GradientShap,
         IntegratedGradients,
@@ -49,14 +53,14 @@ if util.find_spec("captum"):
         InternalInfluence,
         LayerGradientXActivation,
     )
-if util.find_spec("zennit"):
+if _ZENNIT_AVAILABLE:
     from zennit import canonizers as zcanon
     from zennit import composites as zcomp
     from zennit import attribution as zattr
     from zennit import core as zcore
 if util.find_spec("tensorflow"):
     import tensorflow as tf
-if util.find_spec("tf_explain"):
+if _TF_EXPLAIN_AVAILABLE:
     import tf_explain
 
 
@@ -103,14 +107,14 @@ def explain(model, inputs, targets, **kwargs) -> np.ndarray:
              Returns np.ndarray of same shape as inputs.
     """
 
-    if util.find_spec("captum") or util.find_spec("tf_explain"):
+    if _CAPTUM_AVAILABLE or _TF_EXPLAIN_AVAILABLE:
         if "method" not in kwargs:
             warnings.warn(
                 f"Using quantus 'explain' function as an explainer without specifying 'method' (string) "
                 f"in kwargs will produce a vanilla 'Gradient' explanation.\n",
                 category=UserWarning,
             )
-    elif util.find_spec("zennit"):
+    elif _ZENNIT_AVAILABLE:
         if "attributor" not in kwargs:
             warnings.warn(
                 f"Using quantus 'explain' function as an explainer without specifying 'attributor'"
@@ -174,17 +178,17 @@ def get_explanation(model, inputs, targets, **kwargs):
     """
     xai_lib = kwargs.get("xai_lib", "captum")
     if isinstance(model, torch.nn.Module):
-        if util.find_spec("captum") and util.find_spec("zennit"):
+        if _CAPTUM_AVAILABLE and _ZENNIT_AVAILABLE:
             if xai_lib == "captum":
                 return generate_captum_explanation(model, inputs, targets, **kwargs)
             if xai_lib == "zennit":
                 return generate_zennit_explanation(model, inputs, targets, **kwargs)
-        if util.find_spec("captum"):
+        if _CAPTUM_AVAILABLE:
             return generate_captum_explanation(model, inputs, targets, **kwargs)
-        if util.find_spec("zennit"):
+        if _ZENNIT_AVAILABLE:
             return generate_zennit_explanation(model, inputs, targets, **kwargs)
     if isinstance(model, tf.keras.Model):
-        if util.find_spec("tf_explain"):
+        if _TF_EXPLAIN_AVAILABLE:
             return generate_tf_explanation(model, inputs, targets, **kwargs)
         else:
             raise ValueError(
@@ -197,6 +201,41 @@ def get_explanation(model, inputs, targets, **kwargs):
     )
 
 
+def _explain_per_sample(
+    explain_sample: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    inputs: np.ndarray,
+    targets: np.ndarray,
+) -> np.ndarray:
+    """
+    Explain a batch one sample at a time, as tf-explain explainers take a single target class per call,
+    and rescale the explanations from the [0, 255] image range to [0, 1]. The explanations are written
+    into one preallocated array, rather than stacking a list of them and dividing the stacked copy.
+
+    Parameters
+    ----------
+    explain_sample: callable
+        Callable returning the explanation for a single input and target.
+    inputs: np.ndarray
+         The inputs that ought to be explained.
+    targets: np.ndarray
+         The target lables that should be used in the explanation.
+
+    Returns
+    -------
+    explanation: np.ndarray
+         The explanations of the batch, as floats.
+    """
+    n_samples = min(len(inputs), len(targets))
+    explanation = np.empty((0,), dtype=float)
+    for i, (x, y) in enumerate(zip(inputs, targets)):
+        explanation_sample = explain_sample(x, y)
+        if i == 0:
+            explanation = np.empty((n_samples, *np.shape(explanation_sample)), dtype=float)
+        explanation[i] = explanation_sample
+    explanation /= 255
+    return explanation
+
+
 def generate_tf_explanation(
     model, inputs: np.array, targets: np.array, **kwargs
 ) -> np.ndarray:
@@ -275,8 +314,6 @@ def generate_tf_explanation(
 
     inputs = make_channel_last(inputs, channel_first)
 
-    explanation: np.ndarray = np.zeros_like(inputs)
-
     if method in constants.DEPRECATED_XAI_METHODS_TF:
         warnings.warn(
             f"Explanation method string {method} is deprecated. Use "
@@ -287,57 +324,33 @@ def generate_tf_explanation(
 
     if method == "VanillaGradients":
         explainer = tf_explain.core.vanilla_gradients.VanillaGradients()
-        explanation = (
-            np.array(
-                list(
-                    map(
-                        lambda x, y: explainer.explain(
-                            ([x], None), model, y, **xai_lib_kwargs
-                        ),
-                        inputs,
-                        targets,
-                    )
-                ),
-                dtype=float,
-            )
-            / 255
+        explanation = _explain_per_sample(
+            lambda x, y: explainer.explain(
+                ([x], None), model, y, **xai_lib_kwargs
+            ),
+            inputs,
+            targets,
         )
 
     elif method == "IntegratedGradients":
         n_steps = kwargs.get("n_steps", 10)
         explainer = tf_explain.core.integrated_gradients.IntegratedGradients()
-        explanation = (
-            np.array(
-                list(
-                    map(
-                        lambda x, y: explainer.explain(
-                            ([x], None), model, y, n_steps=n_steps, **xai_lib_kwargs
-                        ),
-                        inputs,
-                        targets,
-                    )
-                ),
-                dtype=float,
-            )
-            / 255
+        explanation = _explain_per_sample(
+            lambda x, y: explainer.explain(
+                ([x], None), model, y, n_steps=n_steps, **xai_lib_kwargs
+            ),
+            inputs,
+            targets,
         )
 
     elif method == "GradientsInput":
         explainer = tf_explain.core.gradients_inputs.GradientsInputs()
-        explanation = (
-            np.array(
-                list(
-                    map(
-                        lambda x, y: explainer.explain(
-                            ([x], None), model, y, **xai_lib_kwargs
-                        ),
-                        inputs,
-                        targets,
-                    )
-                ),
-                dtype=float,
-            )
-            / 255
+        explanation = _explain_per_sample(
+            lambda x, y: explainer.explain(
+                ([x], None), model, y, **xai_lib_kwargs
+            ),
+            inputs,
+            targets,
         )
 
     elif method == "OcclusionSensitivity":
@@ -346,24 +359,16 @@ def generate_tf_explanation(
         keepdims = kwargs.get("keepdims", False)
         keep_dim = False
         explainer = tf_explain.core.occlusion_sensitivity.OcclusionSensitivity()
-        explanation = (
-            np.array(
-                list(
-                    map(
-                        lambda x, y: explainer.explain(
-                            ([x], None),
-                            model,
-                            y,
-                            patch_size=patch_size,
-                            **xai_lib_kwargs,
-                        ),
-                        inputs,
-                        targets,
-                    )
-                ),
-                dtype=float,
-            )
-            / 255
+        explanation = _explain_per_sample(
+            lambda x, y: explainer.explain(
+                ([x], None),
+                model,
+                y,
+                patch_size=patch_size,
+                **xai_lib_kwargs,
+            ),
+            inputs,
+            targets,
         )
 
     elif method == "GradCAM":
@@ -374,45 +379,29 @@ def generate_tf_explanation(
             xai_lib_kwargs["layer_name"] = kwargs["gc_layer"]
 
         explainer = tf_explain.core.grad_cam.GradCAM()
-        explanation = (
-            np.array(
-                list(
-                    map(
-                        lambda x, y: explainer.explain(
-                            ([x], None), model, y, **xai_lib_kwargs
-                        ),
-                        inputs,
-                        targets,
-                    )
-                ),
-                dtype=float,
-            )
-            / 255
+        explanation = _explain_per_sample(
+            lambda x, y: explainer.explain(
+                ([x], None), model, y, **xai_lib_kwargs
+            ),
+            inputs,
+            targets,
         )
 
     elif method == "SmoothGrad":
         num_samples = kwargs.get("num_samples", 5)
         noise = kwargs.get("noise", 0.1)
         explainer = tf_explain.core.smoothgrad.SmoothGrad()
-        explanation = (
-            np.array(
-                list(
-                    map(
-                        lambda x, y: explainer.explain(
-                            ([x], None),
-                            model,
-                            y,
-                            num_samples=num_samples,
-                            noise=noise,
-                            **xai_lib_kwargs,
-                        ),
-                        inputs,
-                        targets,
-                    )
-                ),
-                dtype=float,
-            )
-            / 255
+        explanation = _explain_per_sample(
+            lambda x, y: explainer.explain(
+                ([x], None),
+                model,
+                y,
+                num_samples=num_samples,
+                noise=noise,
+                **xai_lib_kwargs,
+            ),
+            inputs,
+            targets,
         )
 
     else:
@@ -478,6 +467,11 @@ def generate_captum_explanation(
                 (8, 28, 28, -1). Passing "()" will keep the original dimensions.
             keepdims: boolean
                 Indicated if the reduced axes shall be preserved (True) or removed (False).
+            baseline: torch.Tensor, optional
+                The baseline of IntegratedGradients, captum integrates from zero if None.
+            internal_batch_size: integer, optional
+                The number of scaled inputs IntegratedGradients evaluates in one forward/ backward pass,
+                all len(inputs) * n_steps at once if None.
     Returns
     -------
     explanation: np.ndarray
@@ -541,8 +535,6 @@ def generate_captum_explanation(
         def f_reduce_axes(a):
             return a.sum(**reduce_axes)
 
-    explanation: torch.Tensor = torch.zeros_like(inputs)
-
     if method in constants.DEPRECATED_XAI_METHODS_CAPTUM:
         warnings.warn(
             f"Explanaiton method string {method} is deprecated. Use "
@@ -565,9 +557,9 @@ def generate_captum_explanation(
         )
 
     elif method == "IntegratedGradients":
-        baselines = (
-            kwargs["baseline"] if "baseline" in kwargs else torch.zeros_like(inputs)
-        )
+        # Without a baseline, captum integrates from a zero scalar, which saves
+        # allocating and subtracting a zero tensor of the size of the inputs.
+        baselines = kwargs.get("baseline", None)
         attr_func = eval(method)
         explanation = f_reduce_axes(
             attr_func(model, **xai_lib_kwargs).attribute(
@@ -576,6 +568,8 @@ def generate_captum_explanation(
                 baselines=baselines,
                 n_steps=10,
                 method="riemann_trapezoid",
+                # Optionally evaluate the len(inputs) * n_steps scaled inputs in smaller chunks.
+                internal_batch_size=kwargs.get("internal_batch_size", None),
             )
         )
 
@@ -867,17 +861,21 @@ def generate_zennit_explanation(
         }
     )
 
-    n_outputs = model(inputs).shape[1]
+    # The number of outputs is only needed to one-hot encode the targets, so skip this
+    # extra forward pass (and its autograd graph) when an attr_output is given.
+    output_target = None
+    if "attr_output" not in attributor_kwargs.keys():
+        with torch.no_grad():
+            n_outputs = model(inputs).shape[1]
+        # One-hot encode the targets directly, instead of indexing rows of an
+        # (n_outputs, n_outputs) identity matrix.
+        output_target = torch.nn.functional.one_hot(
+            targets.reshape(-1).long(), num_classes=n_outputs
+        ).to(device=inputs.device, dtype=inputs.dtype)
 
     # Get the attributions.
     with attributor:
-        if "attr_output" in attributor_kwargs.keys():
-            _, explanation = attributor(inputs, None)
-        else:
-            eye = torch.eye(n_outputs, device=device)
-            output_target = eye[targets]
-            output_target = output_target.reshape(-1, n_outputs)
-            _, explanation = attributor(inputs, output_target)
+        _, explanation = attributor(inputs, output_target)
 
     if isinstance(explanation, torch.Tensor):
         if explanation.requires_grad:
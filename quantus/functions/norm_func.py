@@ -42,7 +42,10 @@ def l2_norm(a: np.array) -> float:
         The norm.
     """
     assert a.ndim == 1 or a.ndim == 2, "Check that 'l2_norm' receives a 1D array."
-    return np.linalg.norm(a, axis=-1)
+    # Accumulate in floating point (like np.linalg.norm), integer inputs would overflow.
+    if not np.issubdtype(a.dtype, np.floating):
+        a = a.astype(np.float64)
+    return np.sqrt(np.einsum("...i,...i->...", a, a))
 
 
 def linf_norm(a: np.array) -> float:
@@ -248,3 +248,7 @@ def normalise_by_average_second_moment_estimate(
         )
 
     return a
+
+
+# Normalisation functions that only divide the attributions by a positive constant.
+SCALING_NORMALISE_FUNCS = (normalise_by_max, normalise_by_average_second_moment_estimate)
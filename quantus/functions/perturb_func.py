@@ -391,13 +391,47 @@ def batch_gaussian_noise(
         len(indices.shape) == 2
     ), "The indices array must be 2-dimensional, first dimension corresponding to the batch size, and the second to the indices to perturb"
 
-    batch_size = arr.shape[0]
-    arr_perturbed = copy.copy(arr)
-
     # Sample the noise.
     noise = np.random.normal(loc=perturb_mean, scale=perturb_std, size=arr.shape)
 
+    return _batch_add_noise(arr, indices, noise)
+
+
+def _batch_add_noise(arr: np.array, indices: np.array, noise: np.array) -> np.array:
+    """
+    Add the noise to a batch of 2D arrays at indices.
+
+    Parameters
+    ----------
+    arr: np.ndarray
+         Array to be perturbed.
+    indices: np.ndarray
+        Array of shape (batch_size, n_indices), the indices to perturb per instance.
+    noise: np.ndarray
+        Array of the same shape as arr, the noise to add. May be overwritten.
+
+    Returns
+    -------
+    arr_perturbed: np.ndarray
+         The array which some of its indices have been perturbed.
+    """
+    # If every feature is perturbed (indices broadcast from one full range), skip the fancy indexing.
+    if (
+        indices.shape == arr.shape
+        and indices.strides[0] == 0
+        and np.array_equal(indices[0], np.arange(arr.shape[1]))
+    ):
+        if np.issubdtype(arr.dtype, np.floating):
+            # Add the noise in the precision of the input, e.g., float32 images, and
+            # write the result into the noise buffer instead of allocating another array.
+            noise = noise.astype(arr.dtype, copy=False)
+            noise += arr
+            return noise
+        return (arr + noise).astype(arr.dtype, copy=False)
+
     # Perturb the array.
+    batch_size = arr.shape[0]
+    arr_perturbed = copy.copy(arr)
     arr_perturbed[np.arange(batch_size)[:, None], indices] = (arr_perturbed + noise)[
         np.arange(batch_size)[:, None], indices
     ]
@@ -495,9 +529,6 @@ def batch_uniform_noise(
         len(indices.shape) == 2
     ), "The indices array must be 2-dimensional, first dimension corresponding to the batch size, and the second to the indices to perturb"
 
-    batch_size = arr.shape[0]
-    arr_perturbed = copy.copy(arr)
-
     # Sample the noise.
     if upper_bound is None:
         noise = np.random.uniform(low=-lower_bound, high=lower_bound, size=arr.shape)
@@ -509,12 +540,7 @@ def batch_uniform_noise(
         )
         noise = np.random.uniform(low=lower_bound, high=upper_bound, size=arr.shape)
 
-    # Perturb the array.
-    arr_perturbed[np.arange(batch_size)[:, None], indices] = (arr_perturbed + noise)[
-        np.arange(batch_size)[:, None], indices
-    ]
-
-    return arr_perturbed
+    return _batch_add_noise(arr, indices, noise)
 
 
 def rotation(arr: np.array, perturb_angle: float = 10, **kwargs) -> np.array:
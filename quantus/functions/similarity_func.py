@@ -123,7 +123,9 @@ def distance_euclidean(a: np.array, b: np.array, **kwargs) -> Union[float, np.ar
     Union[float, np.array]
         The similarity score or a batch of similarity scores.
     """
-    return ((a - b) ** 2).sum(axis=-1) ** 0.5
+    # The row-wise dot product avoids allocating the squared differences.
+    diff = np.subtract(a, b)
+    return np.sqrt(np.einsum("...i,...i->...", diff, diff))
 
 
 def distance_manhattan(a: np.array, b: np.array, **kwargs) -> Union[float, np.array]:
@@ -112,6 +112,24 @@ def assert_nr_segments(nr_segments: int) -> None:
     ), "The number of segments from the segmentation algorithm must be more than one."
 
 
+def assert_nr_samples_per_batch(nr_samples_per_batch: int) -> None:
+    """
+    Assert that at least one perturbation sample is explained per batch.
+
+    Parameters
+    ----------
+    nr_samples_per_batch: integer
+        The number of perturbed copies of the data batch that are explained together.
+
+    Returns
+    -------
+    None
+    """
+    assert (
+        nr_samples_per_batch >= 1
+    ), "The number of samples per batch 'nr_samples_per_batch' must be at least one."
+
+
 def assert_layer_order(layer_order: str) -> None:
     """
     Assert that layer order is in pre-defined list.
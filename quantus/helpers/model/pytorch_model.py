@@ -123,6 +123,21 @@ class PyTorchModel(ModelInterface[nn.Module]):
         ],
         model_predict_kwargs: Dict[str, Any],
     ) -> torch.Tensor:
+        pred_model, args, inputs_kwargs = self._get_prediction_inputs(x)
+        pred = pred_model(*args, **inputs_kwargs, **model_predict_kwargs)
+        return self._get_prediction_outputs(pred)
+
+    def _get_prediction_inputs(
+        self,
+        x: Union[
+            torch.Tensor,
+            npt.ArrayLike,
+            Mapping[str, Union[torch.Tensor, npt.ArrayLike]],
+        ],
+    ) -> Tuple[nn.Module, Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Get the module to predict with and its positional and keyword tensor inputs for the given input.
+        """
         if safe_isinstance(self.model, "transformers.modeling_utils.PreTrainedModel"):
 
             if not is_batch_encoding_like(x):
@@ -131,18 +146,23 @@ class PyTorchModel(ModelInterface[nn.Module]):
                     "or make sure you're passing a dict with input_ids and attention_mask as keys"
                 )
 
-            x = {k: torch.as_tensor(v, device=self.device) for k, v in x.items()}
-            pred = self.model(**x, **model_predict_kwargs).logits
-            if self.softmax:
-                return torch.softmax(pred, dim=-1)
-            return pred
+            return self.model, (), {k: torch.as_tensor(v, device=self.device) for k, v in x.items()}
 
         elif isinstance(self.model, nn.Module):
-            pred_model = self.get_softmax_arg_model()
-            return pred_model(torch.Tensor(x).to(self.device), **model_predict_kwargs)
+            return self.get_softmax_arg_model(), (torch.Tensor(x).to(self.device),), {}
         else:
             raise ValueError("Predictions cant be null")
 
+    def _get_prediction_outputs(self, pred: Any) -> torch.Tensor:
+        """
+        Get the predictions from the output of the module returned by _get_prediction_inputs.
+        """
+        if safe_isinstance(self.model, "transformers.modeling_utils.PreTrainedModel"):
+            pred = pred.logits
+            if self.softmax:
+                return torch.softmax(pred, dim=-1)
+        return pred
+
     def get_softmax_arg_model(self) -> torch.nn.Module:
         """
         Returns model with last layer adjusted accordingly to softmax argument.
@@ -331,6 +351,162 @@ class PyTorchModel(ModelInterface[nn.Module]):
             module[1].reset_parameters()
             yield module[0], random_layer_model
 
+    def state_dict_difference(self, model: nn.Module) -> Dict[str, torch.Tensor]:
+        """
+        Get the parameters and buffers of the given model (e.g., a randomised copy yielded by
+        get_random_layer_generator) that differ from the ones of the wrapped model.
+
+        Parameters
+        ----------
+        model: torch.nn.Module
+            A model with the same architecture as the wrapped model.
+
+        Returns
+        --------
+        dict
+            A (partial) state dictionary, which holds copies of the differing tensors only.
+        """
+        original_parameters = self.state_dict()
+        return {
+            k: v.detach().clone()
+            for k, v in model.state_dict().items()
+            if not torch.equal(v, original_parameters[k])
+        }
+
+    def predict_with_parameters(
+        self,
+        x: Union[np.ndarray, Mapping[str, np.ndarray]],
+        parameters: List[Dict[str, torch.Tensor]],
+        chunk_size: int = 8,
+        batch_size: Optional[int] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Predict on the given input for several versions of the model's parameters, e.g., the
+        randomised models yielded by get_random_layer_generator.
+
+        Every parameter set only needs to hold the tensors that differ from the wrapped model (see
+        state_dict_difference), the remaining ones are taken from the wrapped model. Up to chunk_size
+        parameter sets are stacked and evaluated with a single vectorised forward pass
+        (torch.func.functional_call + torch.func.vmap). Falls back to one forward pass per parameter set
+        if torch.func is not available (torch<2.0) or the model cannot be vectorised, e.g., because it uses
+        unsupported or in-place operations.
+
+        A vectorised forward pass holds the stacked parameters and the activations of chunk_size model
+        versions at once, i.e., it needs up to chunk_size times the memory of a regular forward pass.
+
+        Parameters
+        ----------
+        x: np.ndarray, BatchEncoding
+            A given input that the wrapped model predicts on, converted as in predict.
+        parameters: list
+            A list of (partial) state dictionaries of the wrapped model.
+        chunk_size: integer
+            The maximum number of parameter sets evaluated in one vectorised forward pass, default=8.
+        batch_size: integer, optional
+            The number of inputs predicted on in one forward pass, all at once if None, default=None.
+        kwargs: optional
+            Keyword arguments.
+
+        Returns
+        --------
+        np.ndarray
+            Predictions of shape (len(parameters), len(x), ...).
+        """
+        model_predict_kwargs = {**self.model_predict_kwargs, **kwargs}
+        if self.model.training:
+            raise AttributeError("Torch model needs to be in the evaluation mode.")
+
+        # Convert the inputs like predict does, in batches of up to batch_size inputs.
+        n_inputs = len(next(iter(x.values()))) if isinstance(x, Mapping) else len(x)
+        if batch_size is None:
+            batch_size = n_inputs
+        batch_inputs = [
+            self._get_prediction_inputs(
+                {k: v[start : start + batch_size] for k, v in x.items()}
+                if isinstance(x, Mapping)
+                else x[start : start + batch_size]
+            )
+            for start in range(0, n_inputs, batch_size)
+        ]
+
+        pred_model = batch_inputs[0][0]
+        original_parameters = pred_model.state_dict()
+
+        # If a softmax layer was appended, the model's parameters are nested under the first module.
+        prefix = ""
+        if isinstance(pred_model, nn.Sequential) and pred_model[0] is self.model:
+            prefix = "0."
+
+        def forward(stacked_params, shared_params, args, inputs_kwargs):
+            pred = torch.func.functional_call(
+                pred_model,
+                (stacked_params, shared_params),
+                args,
+                {**inputs_kwargs, **model_predict_kwargs},
+            )
+            return self._get_prediction_outputs(pred)
+
+        vectorise = hasattr(torch, "func")
+        loop_model = None
+        preds = []
+        with torch.no_grad():
+            for start in range(0, len(parameters), chunk_size):
+                chunk = [
+                    {prefix + k: v.to(self.device) for k, v in params.items()}
+                    for params in parameters[start : start + chunk_size]
+                ]
+
+                if vectorise:
+                    # Stack the tensors that differ between the parameter sets, share all others.
+                    stacked, shared = {}, {}
+                    for name in {name for params in chunk for name in params}:
+                        tensors = [params.get(name, original_parameters[name]) for params in chunk]
+                        if all(torch.equal(tensors[0], t) for t in tensors[1:]):
+                            shared[name] = tensors[0]
+                        else:
+                            stacked[name] = torch.stack(tensors)
+
+                    try:
+                        chunk_preds = []
+                        for _, args, inputs_kwargs in batch_inputs:
+                            if not stacked:
+                                # All parameter sets are identical, a single forward pass suffices.
+                                pred = forward({}, shared, args, inputs_kwargs)
+                                pred = pred.unsqueeze(0).expand(len(chunk), *pred.shape)
+                            else:
+                                pred = torch.func.vmap(forward, in_dims=(0, None, None, None))(
+                                    stacked, shared, args, inputs_kwargs
+                                )
+                            chunk_preds.append(pred.cpu().numpy())
+                        preds.append(np.concatenate(chunk_preds, axis=1))
+                        continue
+                    except RuntimeError as e:
+                        # vmap raises a RuntimeError (or NotImplementedError) for unsupported operations.
+                        logging.info(f"Vectorised prediction failed, predicting per parameter set: {e}")
+                        vectorise = False
+
+                # Load every parameter set into a copy of the model, one after another.
+                if loop_model is None:
+                    loop_model = deepcopy(pred_model)
+                for params in chunk:
+                    loop_model.load_state_dict(original_parameters)
+                    loop_model.load_state_dict(params, strict=False)
+                    preds.append(
+                        np.concatenate(
+                            [
+                                self._get_prediction_outputs(
+                                    loop_model(*args, **inputs_kwargs, **model_predict_kwargs)
+                                )
+                                .cpu()
+                                .numpy()
+                                for _, args, inputs_kwargs in batch_inputs
+                            ]
+                        )[None]
+                    )
+
+        return np.concatenate(preds)
+
     def sample(
         self,
         mean: float,
@@ -407,11 +583,12 @@ class PyTorchModel(ModelInterface[nn.Module]):
             delta = torch.zeros(size=shape).fill_(input_shift)
             fw = module[1].forward(delta)[0]
 
-            for i in range(module[1].out_channels):
-                if self.channel_first:
-                    module[1].bias[i] = torch.nn.Parameter(2 * module[1].bias[i] - torch.unique(fw[i])[0])
-                else:
-                    module[1].bias[i] = torch.nn.Parameter(2 * module[1].bias[i] - torch.unique(fw[..., i])[0])
+            # The smallest output value of each channel, i.e., torch.unique(fw[i])[0], for all channels at once.
+            if self.channel_first:
+                fw_min = fw.reshape(module[1].out_channels, -1).min(dim=1).values
+            else:
+                fw_min = fw.reshape(-1, module[1].out_channels).min(dim=0).values
+            module[1].bias.copy_(2 * module[1].bias - fw_min)
 
         return new_model
 
@@ -338,16 +338,17 @@ class TensorFlowModel(ModelInterface[Model]):
 
         delta = np.zeros(shape=shape)
         delta.fill(input_shift)
-        fw = tmp_model(delta)[0]
+        fw = np.asarray(tmp_model(delta)[0])
 
         weights = module.get_weights()
         bias = weights[1]
 
-        for i in range(len(bias)):
-            if self.channel_first:
-                weights[1][i] = 2 * bias[i] - np.unique(fw[i])[0]
-            else:
-                weights[1][i] = 2 * bias[i] - np.unique(fw[..., i])[0]
+        # The smallest output value of each channel, i.e., np.unique(fw[i])[0], for all channels at once.
+        if self.channel_first:
+            fw_min = fw.reshape(len(bias), -1).min(axis=1)
+        else:
+            fw_min = fw.reshape(-1, len(bias)).min(axis=0)
+        weights[1] = 2 * bias - fw_min
 
         module.set_weights(weights)
         return new_model
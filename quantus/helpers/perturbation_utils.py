@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import sys
-from typing import List, TYPE_CHECKING, Callable, Mapping, Optional
+from typing import List, TYPE_CHECKING, Callable, Generator, Mapping, Optional, Tuple
 import numpy as np
 import functools
+from sklearn.utils import gen_batches
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -37,7 +38,7 @@ def make_perturb_func(
 
 def make_changed_prediction_indices_func(
     return_nan_when_prediction_changes: bool,
-) -> Callable[[ModelInterface, np.ndarray, np.ndarray], List[int]]:
+) -> Callable[..., List[int]]:
     """A utility function to improve static analysis."""
     return functools.partial(
         changed_prediction_indices,
@@ -50,6 +51,7 @@ def changed_prediction_indices(
     x_batch: np.ndarray,
     x_perturbed: np.ndarray,
     return_nan_when_prediction_changes: bool,
+    y_pred_batch: Optional[np.ndarray] = None,
 ) -> List[int]:
     """
     Find indices in batch, for which predicted label has changed after applying perturbation.
@@ -63,7 +65,11 @@ def changed_prediction_indices(
     x_batch:
         Batch of original inputs provided by user.
     x_perturbed:
-        Batch of inputs after applying perturbation.
+        Batch of inputs after applying perturbation. It may also hold several stacked
+        perturbed copies of x_batch, in which case x_batch is only predicted once.
+    y_pred_batch:
+        Predicted labels for x_batch. If given, x_batch is not predicted again, which saves a
+        forward pass when the same batch is perturbed several times.
 
     Returns
     -------
@@ -76,7 +82,74 @@ def changed_prediction_indices(
     if not return_nan_when_prediction_changes:
         return []
 
-    labels_before = model.predict(x_batch).argmax(axis=-1)
+    if y_pred_batch is None:
+        y_pred_batch = model.predict(x_batch).argmax(axis=-1)
+    n_samples = len(x_perturbed) // len(x_batch)
+    labels_before = np.tile(y_pred_batch, (n_samples,) + (1,) * (np.ndim(y_pred_batch) - 1))
     labels_after = model.predict(x_perturbed).argmax(axis=-1)
     changed_idx = np.reshape(np.argwhere(labels_before != labels_after), -1)
     return changed_idx.tolist()
+
+
+def perturb_sample_batches(
+    perturb_func: PerturbFunc,
+    x_batch: np.ndarray,
+    y_batch: np.ndarray,
+    a_batch: np.ndarray,
+    nr_samples: int,
+    nr_samples_per_batch: int,
+) -> Generator[Tuple[slice, np.ndarray, np.ndarray, np.ndarray, np.ndarray], None, None]:
+    """
+    Perturb nr_samples copies of a batch, in chunks of up to nr_samples_per_batch stacked copies,
+    so the perturbations of a chunk can be explained in one call.
+
+    The copies are stacked sample-major, i.e., results of a chunk can be reshaped to
+    (n_samples, batch_size, ...).
+
+    Parameters
+    ----------
+    perturb_func:
+        Batched perturbation function, which is applied on all features of the flattened inputs.
+    x_batch:
+        Batch of original inputs provided by user.
+    y_batch:
+        Batch of labels of x_batch.
+    a_batch:
+        Batch of attributions of x_batch.
+    nr_samples:
+        The number of perturbed copies of the batch.
+    nr_samples_per_batch:
+        The maximum number of copies of the batch in one chunk.
+
+    Returns
+    -------
+
+    samples, x_repeated, x_perturbed, y_repeated, a_repeated:
+        For every chunk, the sample indices, the stacked copies of x_batch, their perturbations and
+        the stacked copies of y_batch and a_batch.
+
+    """
+    batch_size = len(x_batch)
+
+    # The stacks are built once and sliced for the last (possibly smaller) chunk of samples.
+    max_samples = min(nr_samples_per_batch, nr_samples)
+    x_stacked = np.repeat(x_batch[None], max_samples, axis=0).reshape(
+        max_samples * batch_size, *x_batch.shape[1:]
+    )
+    x_stacked_flat = x_stacked.reshape(len(x_stacked), -1)
+    y_stacked = np.tile(y_batch, (max_samples,) + (1,) * (y_batch.ndim - 1))
+    a_stacked = np.tile(a_batch, (max_samples,) + (1,) * (a_batch.ndim - 1))
+    feature_indices = np.arange(0, x_batch[0].size)
+
+    for samples in gen_batches(nr_samples, nr_samples_per_batch):
+        n_repeated = (samples.stop - samples.start) * batch_size
+        x_repeated = x_stacked[:n_repeated]
+
+        # Perturb input, the indices are a read-only view instead of a tiled copy.
+        x_perturbed = perturb_func(
+            arr=x_stacked_flat[:n_repeated],
+            indices=np.broadcast_to(feature_indices, (n_repeated, len(feature_indices))),
+        )
+        x_perturbed = x_perturbed.reshape(*x_repeated.shape)
+
+        yield samples, x_repeated, x_perturbed, y_stacked[:n_repeated], a_stacked[:n_repeated]
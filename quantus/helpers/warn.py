@@ -238,7 +238,9 @@ def deprecation_warnings(kwargs: dict) -> None:
         print(text)
 
 
-def warn_perturbation_caused_no_change(x: np.ndarray, x_perturbed: np.ndarray) -> None:
+def warn_perturbation_caused_no_change(
+    x: np.ndarray, x_perturbed: np.ndarray, batched: bool = False
+) -> None:
     """
     Warn that perturbation applied to input caused no change so that input and perturbed input is the same.
 
@@ -248,12 +250,24 @@ def warn_perturbation_caused_no_change(x: np.ndarray, x_perturbed: np.ndarray) -
          The original input that is considered unperturbed.
     x_perturbed: np.ndarray
          The perturbed input.
+    batched: bool
+        True if arrays are batched, in which case a single warning is raised if any instance is unchanged.
 
     Returns
     -------
     None
     """
-    if np.allclose(x, x_perturbed, equal_nan=True):
+    if batched:
+        unchanged = (
+            np.isclose(x, x_perturbed, equal_nan=True)
+            .reshape(len(x), -1)
+            .all(axis=1)
+            .any()
+        )
+    else:
+        unchanged = np.allclose(x, x_perturbed, equal_nan=True)
+
+    if unchanged:
         warnings.warn(
             "The settings for perturbing input e.g., 'perturb_func' "
             "didn't cause change in input. "
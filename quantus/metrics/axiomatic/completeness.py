@@ -296,7 +296,7 @@ class Completeness(Metric[List[float]]):
         batch_size = x_batch.shape[0]
         a_batch = a_batch.reshape(batch_size, -1)
         n_features = a_batch.shape[-1]
-        indices = np.stack([np.arange(n_features) for _ in x_batch])
+        indices = np.tile(np.arange(n_features), (batch_size, 1))
         x_baseline = self.perturb_func(arr=x_batch.reshape(batch_size, -1), indices=indices)
 
         # Predict on input.
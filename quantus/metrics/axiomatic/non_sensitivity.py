@@ -333,7 +333,7 @@ class NonSensitivity(Metric[List[float]]):
         preds = []
         x_perturbed = x_batch.copy()
         x_batch_shape = x_batch.shape
-        a_indices = np.stack([np.arange(n_features) for _ in x_batch])
+        a_indices = np.tile(np.arange(n_features), (batch_size, 1))
         for perturbation_step_index in range(n_perturbations):
             # Perturb input by indices of attributions.
             a_ix = a_indices[
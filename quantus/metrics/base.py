@@ -152,6 +152,9 @@ class Metric(Generic[R]):
         self.normalise_func = normalise_func
         self.normalise_func_kwargs = normalise_func_kwargs or {}
 
+        # Metrics whose scores do not depend on the normalisation can set this to skip it.
+        self._skip_normalise = False
+
         self.default_plot_func = default_plot_func
 
         # We need underscores here to avoid conflict with @property descriptor.
@@ -449,7 +452,7 @@ class Metric(Generic[R]):
             self.a_axes = utils.infer_attribution_axes(a_batch, x_batch)
 
             # Normalise with specified keyword arguments if requested.
-            if self.normalise:
+            if self.normalise and not self._skip_normalise:
                 a_batch = self.normalise_func(a_batch)
 
             # Take absolute if requested.
@@ -885,6 +888,7 @@ class Metric(Generic[R]):
         model: Union[ModelInterface, keras.Model, nn.Module],
         x_batch: np.ndarray,
         y_batch: np.ndarray,
+        chunk_size: Optional[int] = None,
     ) -> np.ndarray:
         """
         Compute explanations, normalise and take absolute (if was configured so during metric initialization.)
@@ -907,6 +911,9 @@ class Metric(Generic[R]):
             A np.ndarray which contains the input data that are explained.
         y_batch:
             A np.ndarray which contains the output labels that are explained.
+        chunk_size: int, optional
+            If provided, x_batch is treated as several stacked batches of chunk_size, which are
+            explained in one call, but normalised separately.
 
         Returns
         -------
@@ -931,13 +938,26 @@ class Metric(Generic[R]):
         asserts.assert_attributions(x_batch=x_batch, a_batch=a_batch)
 
         # Normalise and take absolute values of the attributions, if configured during metric instantiation.
-        if self.normalise:
-            a_batch = self.normalise_func(a_batch)
+        a_normalised = a_batch
+        if self.normalise and not self._skip_normalise:
+            if chunk_size is None:
+                a_normalised = self.normalise_func(a_batch)
+            else:
+                a_normalised = np.concatenate(
+                    [
+                        self.normalise_func(a_batch[i : i + chunk_size])
+                        for i in range(0, len(a_batch), chunk_size)
+                    ]
+                )
 
         if self.abs:
-            a_batch = np.abs(a_batch)
+            if not np.may_share_memory(a_normalised, a_batch):
+                # Normalisation returned a new array, so take the absolute values in place.
+                a_normalised = np.abs(a_normalised, out=a_normalised)
+            else:
+                a_normalised = np.abs(a_normalised)
 
-        return a_batch
+        return a_normalised
 
     @property
     def display_progressbar(self) -> bool:
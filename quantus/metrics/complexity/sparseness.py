@@ -10,6 +10,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 
+from quantus.functions.complexity_func import gini_coeffiient
 from quantus.helpers import warn
 from quantus.helpers.enums import (
     DataType,
@@ -233,7 +234,7 @@ class Sparseness(Metric[List[float]]):
             **kwargs,
         )
 
-    def evaluate_batch(self, x_batch: np.ndarray, a_batch: np.ndarray, **kwargs) -> List[float]:
+    def evaluate_batch(self, x_batch: np.ndarray, a_batch: np.ndarray, **kwargs) -> np.ndarray:
         """
         This method performs XAI evaluation on a single batch of explanations.
         For more information on the specific logic, we refer the metric’s initialisation docstring.
@@ -255,11 +256,5 @@ class Sparseness(Metric[List[float]]):
         # Flatten the attributions.
         batch_size = a_batch.shape[0]
         a_batch = a_batch.reshape(batch_size, -1)
-        n_features = a_batch.shape[-1]
 
-        a_batch += 1e-7
-        a_batch = np.sort(a_batch, axis=-1)
-
-        a_arange = np.stack([np.arange(1, n_features + 1) for _ in a_batch])
-        score = ((2 * a_arange - n_features - 1) * a_batch).sum(axis=-1) / (n_features * a_batch.sum(axis=-1))
-        return score
+        return gini_coeffiient(a=a_batch, x=x_batch, batched=True)
@@ -7,6 +7,7 @@
 # Quantus project URL: <https://github.com/understandable-machine-intelligence-lab/Quantus>.
 
 import sys
+from importlib import util
 from typing import (
     Any,
     Callable,
@@ -26,8 +27,15 @@ from tqdm.auto import tqdm
 from sklearn.utils import gen_batches
 
 from quantus.functions.similarity_func import correlation_spearman
-from quantus.functions.complexity_func import discrete_entropy, entropy
-from quantus.functions.normalise_func import normalise_by_average_second_moment_estimate
+from quantus.functions.complexity_func import (
+    SCALE_INVARIANT_COMPLEXITY_FUNCS,
+    discrete_entropy,
+    entropy,
+)
+from quantus.functions.normalise_func import (
+    SCALING_NORMALISE_FUNCS,
+    normalise_by_average_second_moment_estimate,
+)
 from quantus.functions import n_bins_func
 from quantus.helpers import asserts, warn, utils
 from quantus.helpers.enums import (
@@ -44,6 +52,9 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import final
 
+if util.find_spec("torch"):
+    from quantus.helpers.model.pytorch_model import PyTorchModel
+
 AVAILABLE_N_BINS_ALGORITHMS = {
     "Freedman Diaconis": n_bins_func.freedman_diaconis_rule,
     "Scotts": n_bins_func.scotts_rule,
@@ -89,6 +100,8 @@ class EfficientMPRT(Metric):
         seed: int = 42,
         compute_extra_scores: bool = False,
         skip_layers: bool = True,
+        vectorise_model_predictions: bool = False,
+        vectorise_chunk_size: int = 8,
         abs: bool = False,
         normalise: bool = False,
         normalise_func: Optional[Callable[[np.ndarray], np.ndarray]] = None,
@@ -121,6 +134,15 @@ class EfficientMPRT(Metric):
         skip_layers: boolean
             Indicates if explanation similarity should be computed only once; between the
             original and fully randomised model, instead of in a layer-by-layer basis.
+        vectorise_model_predictions: boolean
+            Indicates if, for torch models, the outputs of the randomised model versions should be predicted
+            with vectorised forward passes over several parameter sets, instead of one model at a time,
+            default=False.
+        vectorise_chunk_size: integer
+            The number of randomised model versions predicted on in one vectorised forward pass, if
+            vectorise_model_predictions=True. Their changed parameters are kept in memory until then, i.e.,
+            up to vectorise_chunk_size copies of the model parameters, and the forward pass needs up to
+            vectorise_chunk_size times the memory of a regular one, default=8.
         abs: boolean
             Indicates whether absolute operation is applied on the attribution, default=True.
         normalise: boolean
@@ -182,6 +204,19 @@ class EfficientMPRT(Metric):
         self.seed = seed
         self.compute_extra_scores = compute_extra_scores
         self.skip_layers = skip_layers
+        self.vectorise_model_predictions = vectorise_model_predictions
+        self.vectorise_chunk_size = vectorise_chunk_size
+
+        # Dividing all attributions by one positive constant does not change the score of a
+        # scale-invariant complexity function, so the normalisation pass can be skipped. The number
+        # of bins is still estimated on normalised attributions, see find_n_bins.
+        if (
+            self.normalise
+            and not self.normalise_func_kwargs
+            and self.complexity_func in SCALE_INVARIANT_COMPLEXITY_FUNCS
+            and self.normalise_func in SCALING_NORMALISE_FUNCS
+        ):
+            self._skip_normalise = True
 
         # Results are returned/saved as a dictionary not like in the super-class as a list.
         self.evaluation_scores = {}
@@ -340,25 +375,32 @@ class EfficientMPRT(Metric):
             # Set property to False, so we display only 1 pbar.
             self._display_progressbar = False
 
+        # If no attributions were passed, custom_preprocess() already explained the original model.
+        a_full_dataset_is_original = a_batch is None
+
         # Get the number of bins for discrete entropy calculation.
         if "n_bins" not in self.complexity_func_kwargs:
-            if a_batch is None:
-                a_batch = self.explain_batch(
-                    model=model.get_model(),
-                    x_batch=x_full_dataset,
-                    y_batch=y_full_dataset,
-                )
             self.find_n_bins(
-                a_batch=a_batch,
+                a_batch=a_full_dataset if a_full_dataset_is_original else a_batch,
                 n_bins_default=self.complexity_func_kwargs.get("n_bins_default", 100),
                 min_n_bins=self.complexity_func_kwargs.get("min_n_bins", 10),
                 max_n_bins=self.complexity_func_kwargs.get("max_n_bins", 200),
                 debug=self.complexity_func_kwargs.get("debug", False),
             )
 
-        self.explanation_scores_by_layer: Dict[str, List[float]] = {}
+        self.explanation_scores_by_layer: Dict[str, np.ndarray] = {}
         self.model_scores_by_layer: Dict[str, List[float]] = {}
 
+        # If requested for torch models, the model outputs of all layer randomisations are computed at once.
+        torch_model = (
+            model
+            if self.vectorise_model_predictions
+            and util.find_spec("torch")
+            and isinstance(model, PyTorchModel)
+            else None
+        )
+        layer_parameters: Dict[str, Dict[str, Any]] = {}
+
         with pbar as pbar:
             for l_ix, (layer_name, random_layer_model) in enumerate(
                 model.get_random_layer_generator(order=self.layer_order, seed=self.seed)
@@ -366,35 +408,41 @@ class EfficientMPRT(Metric):
                 pbar.desc = layer_name
 
                 if l_ix == 0:
-                    # Generate explanations on original model in batches.
-                    a_original_generator = self.generate_explanations(
-                        model.get_model(), x_full_dataset, y_full_dataset, batch_size
-                    )
+                    # Generate explanations on original model in batches, unless already computed.
+                    if a_full_dataset_is_original:
+                        a_original_generator = self.generate_a_batches(a_full_dataset)
+                    else:
+                        a_original_generator = self.generate_explanations(
+                            model.get_model(), x_full_dataset, y_full_dataset, batch_size
+                        )
 
                     # Compute the complexity of explanations of the original model.
-                    self.explanation_scores_by_layer["orig"] = []
+                    scores = np.empty(len(x_full_dataset), dtype=np.float64)
+                    instance_id = 0
                     for a_batch, a_batch_original in zip(
                         self.generate_a_batches(a_full_dataset), a_original_generator
                     ):
                         for a_instance, a_instance_original in zip(
                             a_batch, a_batch_original
                         ):
-                            score = self.evaluate_instance(
+                            scores[instance_id] = self.evaluate_instance(
                                 model=model,
                                 x=x_batch[0],
                                 y=None,
                                 s=None,
                                 a=a_instance_original,
                             )
-                            self.explanation_scores_by_layer["orig"].append(score)
+                            instance_id += 1
                             pbar.update(1)
+                    self.explanation_scores_by_layer["orig"] = scores
 
                     # Compute the similarity of outputs of the original model.
-                    self.model_scores_by_layer["orig"] = []
-                    y_preds = model.predict(x_full_dataset)
-                    for y_ix, y_pred in enumerate(y_preds):
-                        score = entropy(a=y_pred, x=y_pred)
-                        self.model_scores_by_layer["orig"].append(score)
+                    if torch_model is not None:
+                        layer_parameters["orig"] = {}
+                    else:
+                        self.model_scores_by_layer["orig"] = self.compute_model_scores(
+                            model.predict(x_full_dataset)
+                        )
 
                 # Skip layers if computing delta.
                 if self.skip_layers and (l_ix + 1) < n_layers:
@@ -406,20 +454,33 @@ class EfficientMPRT(Metric):
                 )
 
                 # Compute the complexity of explanations of the perturbed model.
-                self.explanation_scores_by_layer[layer_name] = []
+                scores = np.empty(len(x_full_dataset), dtype=np.float64)
+                instance_id = 0
                 for a_batch, a_batch_perturbed in zip(
                     self.generate_a_batches(a_full_dataset), a_perturbed_generator
                 ):
                     for a_instance, a_instance_perturbed in zip(a_batch, a_batch_perturbed):
-                        score = self.evaluate_instance(
+                        scores[instance_id] = self.evaluate_instance(
                             model=random_layer_model,
                             x=None,
                             y=None,
                             s=None,
                             a=a_instance_perturbed,
                         )
-                        self.explanation_scores_by_layer[layer_name].append(score)
+                        instance_id += 1
                         pbar.update(1)
+                self.explanation_scores_by_layer[layer_name] = scores
+
+                # Store the changed parameters, so several model versions can be predicted on at once.
+                if torch_model is not None:
+                    layer_parameters[layer_name] = torch_model.state_dict_difference(
+                        random_layer_model
+                    )
+                    if len(layer_parameters) >= self.vectorise_chunk_size:
+                        self.compute_vectorised_model_scores(
+                            torch_model, x_full_dataset, layer_parameters, batch_size
+                        )
+                    continue
 
                 # Wrap the model.
                 random_layer_model_wrapped = utils.get_wrapped_model(
@@ -431,53 +492,62 @@ class EfficientMPRT(Metric):
                 )
 
                 # Predict and save complexity scores of the perturbed model outputs.
-                self.model_scores_by_layer[layer_name] = []
-                y_preds = random_layer_model_wrapped.predict(x_full_dataset)
-                for y_ix, y_pred in enumerate(y_preds):
-                    score = entropy(a=y_pred, x=y_pred)
-                    self.model_scores_by_layer[layer_name].append(score)
+                self.model_scores_by_layer[layer_name] = self.compute_model_scores(
+                    random_layer_model_wrapped.predict(x_full_dataset)
+                )
+
+        # Predict with the remaining model versions.
+        if torch_model is not None and layer_parameters:
+            self.compute_vectorised_model_scores(
+                torch_model, x_full_dataset, layer_parameters, batch_size
+            )
 
         # Save evaluation scores as the relative rise in complexity.
         explanation_scores = list(self.explanation_scores_by_layer.values())
-        self.evaluation_scores = [
-            (b - a) / a for a, b in zip(explanation_scores[0], explanation_scores[-1])
-        ]
+        explanation_scores_orig = np.asarray(explanation_scores[0], dtype=np.float64)
+        explanation_scores_rand = np.asarray(explanation_scores[-1], dtype=np.float64)
+        self.evaluation_scores = (
+            (explanation_scores_rand - explanation_scores_orig)
+            / explanation_scores_orig
+        ).tolist()
 
         # Compute extra scores and save the results in metric attributes.
         if self.compute_extra_scores:
             self.scores_extra = {}
+            model_scores = list(self.model_scores_by_layer.values())
+            model_scores_orig = np.asarray(model_scores[0], dtype=np.float64)
+            model_scores_rand = np.asarray(model_scores[-1], dtype=np.float64)
 
             # Compute absolute deltas for explanation scores.
-            self.scores_extra["scores_delta_explanation"] = [
-                b - a for a, b in zip(explanation_scores[0], explanation_scores[-1])
-            ]
+            self.scores_extra["scores_delta_explanation"] = (
+                explanation_scores_rand - explanation_scores_orig
+            ).tolist()
 
             # Compute simple fraction for explanation scores.
-            self.scores_extra["scores_fraction_explanation"] = [
-                b / a if a != 0 else np.nan
-                for a, b in zip(explanation_scores[0], explanation_scores[-1])
-            ]
+            scores_fraction_explanation = self.divide_or_nan(
+                explanation_scores_rand, explanation_scores_orig
+            )
+            self.scores_extra[
+                "scores_fraction_explanation"
+            ] = scores_fraction_explanation.tolist()
 
             # Compute absolute deltas for model scores.
-            model_scores = list(self.model_scores_by_layer.values())
-            self.scores_extra["scores_delta_model"] = [
-                b - a for a, b in zip(model_scores[0], model_scores[-1])
-            ]
+            self.scores_extra["scores_delta_model"] = (
+                model_scores_rand - model_scores_orig
+            ).tolist()
 
             # Compute simple fraction for model scores.
-            self.scores_extra["scores_fraction_model"] = [
-                b / a if a != 0 else np.nan
-                for a, b in zip(model_scores[0], model_scores[-1])
-            ]
+            scores_fraction_model = self.divide_or_nan(
+                model_scores_rand, model_scores_orig
+            )
+            self.scores_extra["scores_fraction_model"] = scores_fraction_model.tolist()
 
             # Compute delta skill score per sample (model versus explanation).
-            self.scores_extra["scores_delta_explanation_vs_models"] = [
-                b / a if a != 0 else np.nan
-                for a, b in zip(
-                    self.scores_extra["scores_fraction_model"],
-                    self.scores_extra["scores_fraction_explanation"],
-                )
-            ]
+            self.scores_extra[
+                "scores_delta_explanation_vs_models"
+            ] = self.divide_or_nan(
+                scores_fraction_explanation, scores_fraction_model
+            ).tolist()
             # Compute the average complexity scores, per sample.
             self.scores_extra[
                 "scores_average_complexity"
@@ -496,6 +566,43 @@ class EfficientMPRT(Metric):
 
         return self.evaluation_scores
 
+    def compute_vectorised_model_scores(
+        self,
+        model: "PyTorchModel",
+        x_batch: np.ndarray,
+        layer_parameters: Dict[str, Dict[str, Any]],
+        batch_size: int,
+    ) -> None:
+        """
+        Predict with several model versions in vectorised forward passes and save the complexity scores of
+        their outputs. The given parameters are removed afterwards, to free their memory.
+
+        Parameters
+        ----------
+        model: PyTorchModel
+            The wrapped original model.
+        x_batch: np.ndarray
+            The input to predict on.
+        layer_parameters: dict
+            The (partial) state dictionaries of the model versions, by layer name (see
+            PyTorchModel.state_dict_difference).
+        batch_size: integer
+            The number of inputs predicted on in one forward pass.
+
+        Returns
+        -------
+        None
+        """
+        y_preds_by_layer = model.predict_with_parameters(
+            x_batch,
+            list(layer_parameters.values()),
+            chunk_size=self.vectorise_chunk_size,
+            batch_size=batch_size,
+        )
+        for layer_name, y_preds in zip(layer_parameters, y_preds_by_layer):
+            self.model_scores_by_layer[layer_name] = self.compute_model_scores(y_preds)
+        layer_parameters.clear()
+
     def evaluate_instance(
         self,
         model: ModelInterface,
@@ -600,6 +707,42 @@ class EfficientMPRT(Metric):
             a = self.explain_batch(model, x, y)
             yield a
 
+    @staticmethod
+    def compute_model_scores(y_preds: np.ndarray) -> List[float]:
+        """
+        Compute the complexity (entropy) of the model outputs, per sample.
+
+        Parameters
+        ----------
+        y_preds: np.ndarray
+            The model predictions.
+
+        Returns
+        -------
+        list
+            The entropy of each prediction.
+        """
+        return [entropy(a=y_pred, x=y_pred) for y_pred in y_preds]
+
+    @staticmethod
+    def divide_or_nan(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Element-wise division a / b, which is np.nan wherever b is zero.
+
+        Parameters
+        ----------
+        a: np.ndarray
+            The dividend.
+        b: np.ndarray
+            The divisor.
+
+        Returns
+        -------
+        np.ndarray
+            The element-wise fraction.
+        """
+        return np.divide(a, b, out=np.full(a.shape, np.nan), where=b != 0)
+
     def generate_a_batches(self, a_full_dataset):
         for batch in gen_batches(len(a_full_dataset), self.batch_size):
             yield a_full_dataset[batch.start : batch.stop]
@@ -715,8 +858,11 @@ class EfficientMPRT(Metric):
         -------
         None
         """
+        # Not every n_bins rule is scale-invariant (e.g., Freedman Diaconis clamps the bin width),
+        # so the attributions are normalised here even if the normalisation is skipped elsewhere.
+        # Normalise a copy, since the normalisation may be in-place and the attributions are reused.
         if self.normalise:
-            a_batch = self.normalise_func(a_batch, **self.normalise_func_kwargs)
+            a_batch = self.normalise_func(a_batch.copy(), **self.normalise_func_kwargs)
 
         if self.abs:
             a_batch = np.abs(a_batch)
@@ -25,6 +25,7 @@ from quantus.helpers.model.model_interface import ModelInterface
 from quantus.helpers.perturbation_utils import (
     make_changed_prediction_indices_func,
     make_perturb_func,
+    perturb_sample_batches,
 )
 from quantus.metrics.base import Metric
 
@@ -75,6 +76,7 @@ class AvgSensitivity(Metric[List[float]]):
         norm_numerator: Optional[Callable] = None,
         norm_denominator: Optional[Callable] = None,
         nr_samples: int = 200,
+        nr_samples_per_batch: int = 1,
         abs: bool = False,
         normalise: bool = False,
         normalise_func: Optional[Callable[[np.ndarray], np.ndarray]] = None,
@@ -105,6 +107,9 @@ class AvgSensitivity(Metric[List[float]]):
             If None, the default value is used, default=fro_norm
         nr_samples: integer
             The number of samples iterated, default=200.
+        nr_samples_per_batch: integer
+            The number of perturbed copies of the data batch that are explained together in one
+            explain_func call. Higher values reduce the number of calls at the cost of memory, default=1.
         normalise: boolean
             Indicates whether normalise operation is applied on the attribution, default=True.
         normalise_func: callable
@@ -151,6 +156,8 @@ class AvgSensitivity(Metric[List[float]]):
 
         # Save metric-specific attributes.
         self.nr_samples = nr_samples
+        self.nr_samples_per_batch = nr_samples_per_batch
+        asserts.assert_nr_samples_per_batch(nr_samples_per_batch=nr_samples_per_batch)
 
         if similarity_func is None:
             similarity_func = difference
@@ -163,6 +170,7 @@ class AvgSensitivity(Metric[List[float]]):
         if norm_denominator is None:
             norm_denominator = norm_func.fro_norm
         self.norm_denominator = norm_denominator
+        self.return_nan_when_prediction_changes = return_nan_when_prediction_changes
         self.changed_prediction_indices = make_changed_prediction_indices_func(return_nan_when_prediction_changes)
         self.mean_func = np.mean if return_nan_when_prediction_changes else np.nanmean
         self.perturb_func = make_perturb_func(
@@ -328,32 +336,44 @@ class AvgSensitivity(Metric[List[float]]):
         batch_size = x_batch.shape[0]
         a_batch = a_batch.reshape(batch_size, -1)
         similarities = np.zeros((batch_size, self.nr_samples)) * np.nan
-        for step_id in range(self.nr_samples):
-            # Perturb input.
-            x_perturbed = self.perturb_func(
-                arr=x_batch.reshape(batch_size, -1),
-                indices=np.tile(np.arange(0, x_batch[0].size), (batch_size, 1)),
-            )
-            x_perturbed = x_perturbed.reshape(*x_batch.shape)
 
-            changed_prediction_indices = self.changed_prediction_indices(model, x_batch, x_perturbed)
+        # The unperturbed attributions do not change across samples.
+        denominator = self.norm_denominator(a=a_batch)
+
+        # Predict the unperturbed batch once, rather than once per chunk of samples.
+        y_pred_batch = None
+        if self.return_nan_when_prediction_changes:
+            y_pred_batch = model.predict(x_batch).argmax(axis=-1)
 
-            for x_instance, x_instance_perturbed in zip(x_batch, x_perturbed):
-                warn.warn_perturbation_caused_no_change(
-                    x=x_instance,
-                    x_perturbed=x_instance_perturbed,
-                )
+        # Explain the perturbations of several stacked copies of the batch in one call.
+        for samples, x_repeated, x_perturbed, y_repeated, a_repeated in perturb_sample_batches(
+            self.perturb_func, x_batch, y_batch, a_batch, self.nr_samples, self.nr_samples_per_batch
+        ):
+            n_samples = samples.stop - samples.start
+
+            changed_prediction_indices = self.changed_prediction_indices(
+                model, x_batch, x_perturbed, y_pred_batch=y_pred_batch
+            )
+
+            warn.warn_perturbation_caused_no_change(
+                x=x_repeated, x_perturbed=x_perturbed, batched=True
+            )
 
             # Generate explanation based on perturbed input x.
-            a_perturbed = self.explain_batch(model, x_perturbed, y_batch)
-            a_perturbed = a_perturbed.reshape(batch_size, -1)
+            a_perturbed = self.explain_batch(
+                model, x_perturbed, y_repeated, chunk_size=batch_size
+            )
+            a_perturbed = a_perturbed.reshape(len(x_repeated), -1)
 
             # Measure similarity.
-            sensitivities = self.similarity_func(a=a_batch, b=a_perturbed)
-            numerator = self.norm_numerator(a=sensitivities)
-            denominator = self.norm_denominator(a=a_batch)
-            similarities[:, step_id] = numerator / denominator
-            similarities[changed_prediction_indices, step_id] = np.nan
+            sensitivities = self.similarity_func(a=a_repeated, b=a_perturbed)
+            # Broadcast, since custom norm functions may return a scalar or a list.
+            numerator = np.broadcast_to(self.norm_numerator(a=sensitivities), len(x_repeated))
+            similarity = numerator.reshape(n_samples, batch_size) / denominator
+            similarity.reshape(-1)[changed_prediction_indices] = np.nan
+
+            # Results are ordered sample-major, i.e., (n_samples, batch_size).
+            similarities[:, samples] = similarity.T
 
         return self.mean_func(similarities, axis=1)
 
@@ -24,6 +24,7 @@ from quantus.helpers.model.model_interface import ModelInterface
 from quantus.helpers.perturbation_utils import (
     make_changed_prediction_indices_func,
     make_perturb_func,
+    perturb_sample_batches,
 )
 from quantus.metrics.base import Metric
 
@@ -70,6 +71,7 @@ class LocalLipschitzEstimate(Metric[List[float]]):
         norm_numerator: Optional[Callable] = None,
         norm_denominator: Optional[Callable] = None,
         nr_samples: int = 200,
+        nr_samples_per_batch: int = 1,
         abs: bool = False,
         normalise: bool = True,
         normalise_func: Optional[Callable[[np.ndarray], np.ndarray]] = None,
@@ -84,6 +86,7 @@ class LocalLipschitzEstimate(Metric[List[float]]):
         disable_warnings: bool = False,
         display_progressbar: bool = False,
         return_nan_when_prediction_changes: bool = False,
+        early_stop_threshold: Optional[float] = None,
         **kwargs,
     ):
         """
@@ -100,6 +103,9 @@ class LocalLipschitzEstimate(Metric[List[float]]):
             If None, the default value is used, default=distance_euclidean.
         nr_samples: integer
             The number of samples iterated, default=200.
+        nr_samples_per_batch: integer
+            The number of perturbed copies of the data batch that are explained together in one
+            explain_func call. Higher values reduce the number of calls at the cost of memory, default=1.
         abs: boolean
             Indicates whether absolute operation is applied on the attribution, default=False.
         normalise: boolean
@@ -130,6 +136,9 @@ class LocalLipschitzEstimate(Metric[List[float]]):
             Indicates whether a tqdm-progress-bar is printed, default=False.
         return_nan_when_prediction_changes: boolean
             When set to true, the metric will be evaluated to NaN if the prediction changes after the perturbation is applied.
+        early_stop_threshold: float, optional
+            If provided, no further samples are drawn for a batch once the estimate of every instance has
+            reached this value, default=None.
         kwargs: optional
             Keyword arguments.
         """
@@ -151,6 +160,8 @@ class LocalLipschitzEstimate(Metric[List[float]]):
 
         # Save metric-specific attributes.
         self.nr_samples = nr_samples
+        self.nr_samples_per_batch = nr_samples_per_batch
+        asserts.assert_nr_samples_per_batch(nr_samples_per_batch=nr_samples_per_batch)
 
         if similarity_func is None:
             similarity_func = lipschitz_constant
@@ -169,8 +180,10 @@ class LocalLipschitzEstimate(Metric[List[float]]):
             perturb_mean=perturb_mean,
             perturb_std=perturb_std,
         )
+        self.return_nan_when_prediction_changes = return_nan_when_prediction_changes
         self.changed_prediction_indices_func = make_changed_prediction_indices_func(return_nan_when_prediction_changes)
         self.max_func = np.max if return_nan_when_prediction_changes else np.nanmax
+        self.early_stop_threshold = early_stop_threshold
 
         # Asserts and warnings.
         if not self.disable_warnings:
@@ -331,40 +344,69 @@ class LocalLipschitzEstimate(Metric[List[float]]):
 
         batch_size = x_batch.shape[0]
         a_batch = a_batch.reshape(batch_size, -1)
+
+        # Compute the similarities in the precision of the inputs (typically float32), since
+        # float64 attributions would upcast every difference taken in the sample loop.
+        if np.issubdtype(x_batch.dtype, np.floating):
+            a_batch = a_batch.astype(x_batch.dtype, copy=False)
+
         similarities = np.zeros((batch_size, self.nr_samples)) * np.nan
-        for step_id in range(self.nr_samples):
-            # Perturb input.
-            x_perturbed = self.perturb_func(
-                arr=x_batch.reshape(batch_size, -1),
-                indices=np.tile(np.arange(0, x_batch[0].size), (batch_size, 1)),
-            )
-            x_perturbed = x_perturbed.reshape(*x_batch.shape)
 
-            changed_prediction_indices = self.changed_prediction_indices_func(model, x_batch, x_perturbed)
+        # Predict the unperturbed batch once, rather than once per chunk of samples.
+        y_pred_batch = None
+        if self.return_nan_when_prediction_changes:
+            y_pred_batch = model.predict(x_batch).argmax(axis=-1)
+
+        n_evaluated = 0
+        # Explain the perturbations of several stacked copies of the batch in one call.
+        for samples, x_repeated, x_perturbed, y_repeated, a_repeated in perturb_sample_batches(
+            self.perturb_func, x_batch, y_batch, a_batch, self.nr_samples, self.nr_samples_per_batch
+        ):
+            n_samples = samples.stop - samples.start
+            x_repeated_flat = x_repeated.reshape(len(x_repeated), -1)
+            x_perturbed_flat = x_perturbed.reshape(len(x_perturbed), -1)
+
+            changed_prediction_indices = self.changed_prediction_indices_func(
+                model, x_batch, x_perturbed, y_pred_batch=y_pred_batch
+            )
 
-            for x_instance, x_instance_perturbed in zip(x_batch, x_perturbed):
-                warn.warn_perturbation_caused_no_change(
-                    x=x_instance,
-                    x_perturbed=x_instance_perturbed,
-                )
+            warn.warn_perturbation_caused_no_change(
+                x=x_repeated, x_perturbed=x_perturbed, batched=True
+            )
 
             # Generate explanation based on perturbed input x.
-            a_perturbed = self.explain_batch(model, x_perturbed, y_batch)
-            a_perturbed = a_perturbed.reshape(batch_size, -1)
+            a_perturbed = self.explain_batch(model, x_perturbed, y_repeated, chunk_size=batch_size)
+            a_perturbed = a_perturbed.reshape(len(x_repeated), -1)
 
             # Measure similarity
             similarity = self.similarity_func(
-                a=a_batch,
+                a=a_repeated,
                 b=a_perturbed,
-                c=x_batch.reshape(batch_size, -1),
-                d=x_perturbed.reshape(batch_size, -1),
+                c=x_repeated_flat,
+                d=x_perturbed_flat,
                 norm_numerator=self.norm_numerator,
                 norm_denominator=self.norm_denominator,
             )
-            similarities[:, step_id] = similarity
-            similarities[changed_prediction_indices, step_id] = np.nan
-
-        return self.max_func(similarities, axis=1)
+            # Broadcast, since custom similarity functions may return a scalar.
+            similarity = np.broadcast_to(similarity, (len(x_repeated),)).astype(np.float64)
+            similarity[changed_prediction_indices] = np.nan
+
+            # Results are ordered sample-major, i.e., (n_samples, batch_size).
+            similarities[:, samples] = similarity.reshape(n_samples, batch_size).T
+            n_evaluated = samples.stop
+
+            # Stop sampling once every instance has reached the threshold. If NaNs are returned for
+            # changed predictions, an instance with a NaN sample keeps its NaN score and counts as done.
+            if self.early_stop_threshold is not None:
+                evaluated = similarities[:, :n_evaluated]
+                estimates = np.where(np.isnan(evaluated), -np.inf, evaluated).max(axis=1)
+                done = estimates >= self.early_stop_threshold
+                if self.return_nan_when_prediction_changes:
+                    done |= np.isnan(evaluated).any(axis=1)
+                if np.all(done):
+                    break
+
+        return self.max_func(similarities[:, :n_evaluated], axis=1)
 
     def custom_preprocess(
         self,
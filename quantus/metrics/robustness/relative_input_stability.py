@@ -18,6 +18,7 @@ import sys
 
 from quantus.functions.normalise_func import normalise_by_average_second_moment_estimate
 from quantus.functions.perturb_func import batch_uniform_noise
+from quantus.helpers import asserts
 from quantus.helpers.enums import (
     DataType,
     EvaluationCategory,
@@ -28,6 +29,7 @@ from quantus.helpers.model.model_interface import ModelInterface
 from quantus.helpers.perturbation_utils import (
     make_changed_prediction_indices_func,
     make_perturb_func,
+    perturb_sample_batches,
 )
 from quantus.helpers.warn import warn_parameterisation
 from quantus.metrics.base import Metric
@@ -67,6 +69,7 @@ class RelativeInputStability(Metric[List[float]]):
     def __init__(
         self,
         nr_samples: int = 200,
+        nr_samples_per_batch: int = 1,
         abs: bool = False,
         normalise: bool = False,
         normalise_func: Optional[Callable[[np.ndarray], np.ndarray]] = None,
@@ -87,6 +90,9 @@ class RelativeInputStability(Metric[List[float]]):
         ----------
         nr_samples: int
             The number of samples iterated, default=200.
+        nr_samples_per_batch: int
+            The number of perturbed copies of the data batch that are explained together in one
+            explain_func call. Higher values reduce the number of calls at the cost of memory, default=1.
         abs: boolean
             Indicates whether absolute operation is applied on the attribution.
         normalise: boolean
@@ -135,8 +141,11 @@ class RelativeInputStability(Metric[List[float]]):
             perturb_func = batch_uniform_noise
 
         self._nr_samples = nr_samples
+        self._nr_samples_per_batch = nr_samples_per_batch
+        asserts.assert_nr_samples_per_batch(nr_samples_per_batch=nr_samples_per_batch)
         self._eps_min = eps_min
         self.perturb_func = make_perturb_func(perturb_func, perturb_func_kwargs, upper_bound=0.2)
+        self._return_nan_when_prediction_changes = return_nan_when_prediction_changes
         self.changed_prediction_indices_func = make_changed_prediction_indices_func(return_nan_when_prediction_changes)
 
         if not self.disable_warnings:
@@ -242,26 +251,20 @@ class RelativeInputStability(Metric[List[float]]):
         ris_obj: np.ndarray
             RIS maximization objective.
         """
-        num_dim = x.ndim
-        if num_dim == 4:
-            norm_function = lambda arr: np.linalg.norm(np.linalg.norm(arr, axis=(-1, -2)), axis=-1)  # noqa
-        elif num_dim == 3:
-            norm_function = lambda arr: np.linalg.norm(arr, axis=(-1, -2))  # noqa
-        elif num_dim == 2:
-            norm_function = lambda arr: np.linalg.norm(arr, axis=-1)
-        else:
+        if x.ndim not in (2, 3, 4):
             raise ValueError("Relative Input Stability only supports 4D, 3D and 2D inputs (batch dimension inclusive).")
 
-        # fmt: off
-        nominator = (e_x - e_xs) / (e_x + (e_x == 0) * self._eps_min)  # prevent division by 0
-        nominator = norm_function(nominator)
-        # fmt: on
+        # The norms are taken over all non-batch axes, so work on flat views.
+        batch_size = x.shape[0]
+        x, xs = x.reshape(batch_size, -1), xs.reshape(batch_size, -1)
+        e_x, e_xs = e_x.reshape(batch_size, -1), e_xs.reshape(batch_size, -1)
+
+        nominator = (e_x - e_xs) / np.where(e_x == 0, self._eps_min, e_x)  # prevent division by 0
+        nominator = np.sqrt(np.einsum("ij,ij->i", nominator, nominator))
 
         denominator = x - xs
-        denominator /= x + (x == 0) * self._eps_min
-        # fmt: off
-        denominator = norm_function(denominator)
-        # fmt: on
+        denominator /= np.where(x == 0, self._eps_min, x)
+        denominator = np.sqrt(np.einsum("ij,ij->i", denominator, denominator))
         denominator += (denominator == 0) * self._eps_min
         return nominator / denominator
 
@@ -295,32 +298,42 @@ class RelativeInputStability(Metric[List[float]]):
         """
         batch_size = x_batch.shape[0]
 
-        # Prepare output array.
-        ris_batch = np.zeros(shape=[self._nr_samples, x_batch.shape[0]])
+        # Predict the unperturbed batch once, rather than once per sample.
+        y_pred_batch = None
+        if self._return_nan_when_prediction_changes:
+            y_pred_batch = model.predict(x_batch).argmax(axis=-1)
 
-        for index in range(self._nr_samples):
-            # Perturb input.
-            x_perturbed = self.perturb_func(
-                arr=x_batch.reshape(batch_size, -1),
-                indices=np.tile(np.arange(0, x_batch[0].size), (batch_size, 1)),
-            )
-            x_perturbed = x_perturbed.reshape(*x_batch.shape)
+        # Keep a running maximum over the samples. np.maximum propagates NaN, like np.max over
+        # all samples would, so an instance whose prediction changed once stays NaN.
+        result = np.full(batch_size, -np.inf)
+
+        # Explain the perturbations of several stacked copies of the batch in one call.
+        for samples, x_repeated, x_perturbed, y_repeated, a_repeated in perturb_sample_batches(
+            self.perturb_func, x_batch, y_batch, a_batch, self._nr_samples, self._nr_samples_per_batch
+        ):
+            n_samples = samples.stop - samples.start
 
             # Generate explanations for perturbed input.
-            a_batch_perturbed = self.explain_batch(model, x_perturbed, y_batch)
+            a_batch_perturbed = self.explain_batch(
+                model, x_perturbed, y_repeated, chunk_size=batch_size
+            )
 
             # Compute maximization's objective.
-            ris = self.relative_input_stability_objective(x_batch, x_perturbed, a_batch, a_batch_perturbed)
-            ris_batch[index] = ris
+            ris = self.relative_input_stability_objective(
+                x_repeated, x_perturbed, a_repeated, a_batch_perturbed
+            )
 
             # If perturbed input caused change in prediction, then it's RIS=nan.
-            changed_prediction_indices = self.changed_prediction_indices_func(model, x_batch, x_perturbed)
+            changed_prediction_indices = self.changed_prediction_indices_func(
+                model, x_batch, x_perturbed, y_pred_batch=y_pred_batch
+            )
 
             if len(changed_prediction_indices) != 0:
-                ris_batch[index, changed_prediction_indices] = np.nan
+                ris[changed_prediction_indices] = np.nan
+
+            # Results are ordered sample-major, i.e., (n_samples, batch_size).
+            np.maximum(result, ris.reshape(n_samples, batch_size).max(axis=0), out=result)
 
-        # Compute RIS.
-        result = np.max(ris_batch, axis=0)
         if self.return_aggregate:
             result = [self.aggregate_func(result)]
 
@@ -139,6 +139,7 @@ class RelativeOutputStability(Metric[List[float]]):
         self._nr_samples = nr_samples
         self._eps_min = eps_min
         self.perturb_func = make_perturb_func(perturb_func, perturb_func_kwargs, upper_bound=0.2)
+        self._return_nan_when_prediction_changes = return_nan_when_prediction_changes
         self.changed_prediction_indices_func = make_changed_prediction_indices_func(return_nan_when_prediction_changes)
 
         if not self.disable_warnings:
@@ -252,22 +253,16 @@ class RelativeOutputStability(Metric[List[float]]):
             ROS maximization objective.
         """
 
-        num_dim = e_x.ndim
-        if num_dim == 4:
-            norm_function = lambda arr: np.linalg.norm(np.linalg.norm(arr, axis=(-1, -2)), axis=-1)  # noqa
-        elif num_dim == 3:
-            norm_function = lambda arr: np.linalg.norm(arr, axis=(-1, -2))  # noqa
-        elif num_dim == 2:
-            norm_function = lambda arr: np.linalg.norm(arr, axis=-1)
-        else:
+        if e_x.ndim not in (2, 3, 4):
             raise ValueError(
                 "Relative Output Stability only supports 4D, 3D and 2D inputs (batch dimension inclusive)."
             )
 
-        # fmt: off
-        nominator = (e_x - e_xs) / (e_x + (e_x == 0) * self._eps_min)  # prevent division by 0
-        nominator = norm_function(nominator)
-        # fmt: on
+        # The attribution norm is taken over all non-batch axes, so work on flat views.
+        e_x, e_xs = e_x.reshape(len(e_x), -1), e_xs.reshape(len(e_xs), -1)
+
+        nominator = (e_x - e_xs) / np.where(e_x == 0, self._eps_min, e_x)  # prevent division by 0
+        nominator = np.linalg.norm(nominator, axis=-1)
 
         denominator = h_x - h_xs
         denominator = np.linalg.norm(denominator, axis=-1)
@@ -305,11 +300,13 @@ class RelativeOutputStability(Metric[List[float]]):
         batch_size = x_batch.shape[0]
         # Execute forward pass on provided inputs.
         logits = model.predict(x_batch)
+        y_pred_batch = logits.argmax(axis=-1)
 
-        # Prepare output array.
-        ros_batch = np.zeros(shape=[self._nr_samples, x_batch.shape[0]])
+        # Keep a running maximum over the samples. np.maximum propagates NaN, like np.max over
+        # all samples would, so an instance whose prediction changed once stays NaN.
+        result = np.full(batch_size, -np.inf)
 
-        for index in range(self._nr_samples):
+        for _ in range(self._nr_samples):
             # Perturb input.
             x_perturbed = self.perturb_func(
                 arr=x_batch.reshape(batch_size, -1),
@@ -324,16 +321,14 @@ class RelativeOutputStability(Metric[List[float]]):
             logits_perturbed = model.predict(x_perturbed)
             # Compute maximization's objective.
             ros = self.relative_output_stability_objective(logits, logits_perturbed, a_batch, a_batch_perturbed)
-            ros_batch[index] = ros
 
             # If perturbed input caused change in prediction, then it's ROS=nan.
-            changed_prediction_indices = self.changed_prediction_indices_func(model, x_batch, x_perturbed)
+            # The perturbed logits are already computed, so they are not predicted again.
+            if self._return_nan_when_prediction_changes:
+                ros[logits_perturbed.argmax(axis=-1) != y_pred_batch] = np.nan
 
-            if len(changed_prediction_indices) != 0:
-                ros_batch[index, changed_prediction_indices] = np.nan
+            np.maximum(result, ros, out=result)
 
-        # Compute ROS.
-        result = np.max(ros_batch, axis=0)
         if self.return_aggregate:
             result = [self.aggregate_func(result)]
 
@@ -149,6 +149,7 @@ class RelativeRepresentationStability(Metric[List[float]]):
         self._layer_names = layer_names
         self._layer_indices = layer_indices
         self.perturb_func = make_perturb_func(perturb_func, perturb_func_kwargs, upper_bound=0.2)
+        self._return_nan_when_prediction_changes = return_nan_when_prediction_changes
         self.changed_prediction_indices_func = make_changed_prediction_indices_func(return_nan_when_prediction_changes)
 
         if not self.disable_warnings:
@@ -260,22 +261,16 @@ class RelativeRepresentationStability(Metric[List[float]]):
             RRS maximization objective.
         """
 
-        num_dim = e_x.ndim
-        if num_dim == 4:
-            norm_function = lambda arr: np.linalg.norm(np.linalg.norm(arr, axis=(-1, -2)), axis=-1)  # noqa
-        elif num_dim == 3:
-            norm_function = lambda arr: np.linalg.norm(arr, axis=(-1, -2))  # noqa
-        elif num_dim == 2:
-            norm_function = lambda arr: np.linalg.norm(arr, axis=-1)
-        else:
+        if e_x.ndim not in (2, 3, 4):
             raise ValueError("Relative Input Stability only supports 4D, 3D and 2D inputs (batch dimension inclusive).")
 
-        # fmt: off
-        nominator = (e_x - e_xs) / (e_x + (e_x == 0) * self._eps_min)  # prevent division by 0
-        nominator = norm_function(nominator)
-        # fmt: on
+        # The attribution norm is taken over all non-batch axes, so work on flat views.
+        e_x, e_xs = e_x.reshape(len(e_x), -1), e_xs.reshape(len(e_xs), -1)
+
+        nominator = (e_x - e_xs) / np.where(e_x == 0, self._eps_min, e_x)  # prevent division by 0
+        nominator = np.linalg.norm(nominator, axis=-1)
         denominator = l_x - l_xs
-        denominator /= l_x + (l_x == 0) * self._eps_min  # prevent division by 0
+        denominator /= np.where(l_x == 0, self._eps_min, l_x)  # prevent division by 0
         denominator = np.linalg.norm(denominator, axis=-1)
         denominator += (denominator == 0) * self._eps_min
         return nominator / denominator
@@ -313,10 +308,16 @@ class RelativeRepresentationStability(Metric[List[float]]):
         # Retrieve internal representation for provided inputs.
         internal_representations = model.get_hidden_representations(x_batch, self._layer_names, self._layer_indices)
 
-        # Prepare output array.
-        rrs_batch = np.zeros(shape=[self._nr_samples, x_batch.shape[0]])
+        # Predict the unperturbed batch once, rather than once per sample.
+        y_pred_batch = None
+        if self._return_nan_when_prediction_changes:
+            y_pred_batch = model.predict(x_batch).argmax(axis=-1)
+
+        # Keep a running maximum over the samples. np.maximum propagates NaN, like np.max over
+        # all samples would, so an instance whose prediction changed once stays NaN.
+        result = np.full(batch_size, -np.inf)
 
-        for index in range(self._nr_samples):
+        for _ in range(self._nr_samples):
             # Perturb input.
             x_perturbed = self.perturb_func(
                 arr=x_batch.reshape(batch_size, -1),
@@ -339,15 +340,16 @@ class RelativeRepresentationStability(Metric[List[float]]):
                 a_batch,
                 a_batch_perturbed,
             )
-            rrs_batch[index] = rrs
             # If perturbed input caused change in prediction, then it's RRS=nan.
-            changed_prediction_indices = self.changed_prediction_indices_func(model, x_batch, x_perturbed)
+            changed_prediction_indices = self.changed_prediction_indices_func(
+                model, x_batch, x_perturbed, y_pred_batch=y_pred_batch
+            )
 
             if len(changed_prediction_indices) != 0:
-                rrs_batch[index, changed_prediction_indices] = np.nan
+                rrs[changed_prediction_indices] = np.nan
+
+            np.maximum(result, rrs, out=result)
 
-        # Compute RRS.
-        result = np.max(rrs_batch, axis=0)
         if self.return_aggregate:
             result = [self.aggregate_func(result)]
 
@@ -1,6 +1,11 @@
 import pytest
 import numpy as np
-from quantus.functions.complexity_func import entropy, gini_coeffiient, discrete_entropy
+from quantus.functions.complexity_func import (
+    SCALE_INVARIANT_COMPLEXITY_FUNCS,
+    entropy,
+    gini_coeffiient,
+    discrete_entropy,
+)
 
 
 @pytest.fixture
@@ -23,9 +28,27 @@ def test_gini_coefficient(array_data):
     assert 0 <= result <= 1, "Gini coefficient should be in the range [0, 1]."
 
 
+@pytest.mark.complexity_func
+def test_gini_coefficient_batched():
+    a = np.random.rand(8, 3, 16, 16)
+    result = gini_coeffiient(a.reshape(8, -1), a, batched=True)
+    expected = [gini_coeffiient(a_i, a) for a_i in a]
+    assert result.shape == (8,), "Output should have one score per sample."
+    assert np.allclose(result, expected), "Batched and single results should match."
+
+
 @pytest.mark.complexity_func
 @pytest.mark.parametrize("n_bins", [10, 50, 100])
 def test_discrete_entropy(array_data, n_bins):
     a, x = array_data
     result = discrete_entropy(a, x, n_bins=n_bins)
     assert isinstance(result, float), "Output should be a float."
+
+
+@pytest.mark.complexity_func
+@pytest.mark.parametrize("complexity_func", SCALE_INVARIANT_COMPLEXITY_FUNCS)
+def test_scale_invariant_complexity_funcs(array_data, complexity_func):
+    a, x = array_data
+    result = complexity_func(a, x)
+    result_scaled = complexity_func(a * 0.25, x)
+    assert np.isclose(result, result_scaled), "Scores should not change when rescaling."
@@ -901,6 +901,28 @@ def test_generate_captum_explanation(
             ), "Test failed."
 
 
+@pytest.mark.explain_func
+def test_generate_captum_explanation_internal_batch_size(
+    load_mnist_model, load_mnist_images, mocker
+):
+    x_batch, y_batch = (load_mnist_images["x_batch"], load_mnist_images["y_batch"])
+    attribute = mocker.spy(IntegratedGradients, "attribute")
+
+    a_batch = {}
+    for internal_batch_size in [None, 7]:
+        a_batch[internal_batch_size] = generate_captum_explanation(
+            model=load_mnist_model,
+            inputs=x_batch,
+            targets=y_batch,
+            method="IntegratedGradients",
+            internal_batch_size=internal_batch_size,
+        )
+        assert (
+            attribute.call_args.kwargs["internal_batch_size"] == internal_batch_size
+        ), "Test failed."
+    assert np.allclose(a_batch[None], a_batch[7], atol=1e-5), "Test failed."
+
+
 @pytest.mark.explain_func
 @pytest.mark.parametrize(
     "model,data,params,expected",
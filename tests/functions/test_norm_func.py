@@ -53,3 +53,12 @@ def test_linf_norm(data: np.ndarray, params: dict, expected: Union[float, dict,
 def test_l2_norm(data: dict, params: dict, expected: Union[float, dict, bool]):
     out = l2_norm(a=data)
     assert out == expected, "Test failed."
+
+
+@pytest.mark.norm_func
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int32, np.int64])
+def test_l2_norm_integer_input(dtype):
+    # The squared sum of integer inputs must not overflow in the input dtype.
+    data = np.array([[100, 100, 100], [1, 2, 3]], dtype=dtype)
+    out = l2_norm(a=data)
+    assert np.allclose(out, np.linalg.norm(data, axis=-1)), "Test failed."
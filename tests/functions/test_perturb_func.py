@@ -415,6 +415,32 @@ def test_gaussian_noise(
     assert any(out.flatten() != data.flatten()) == expected, "Test failed."
 
 
+@pytest.mark.perturb_func
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_batch_gaussian_noise_all_indices(dtype):
+    arr = np.random.rand(4, 30).astype(dtype)
+    indices = np.broadcast_to(np.arange(30), arr.shape)
+    np.random.seed(0)
+    out = batch_gaussian_noise(arr=arr, indices=indices, perturb_std=0.1)
+    np.random.seed(0)
+    expected = batch_gaussian_noise(arr=arr, indices=np.array(indices), perturb_std=0.1)
+    assert out.dtype == arr.dtype, "Test failed."
+    assert np.allclose(out, expected, atol=1e-6), "Test failed."
+
+
+@pytest.mark.perturb_func
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_batch_uniform_noise_all_indices(dtype):
+    arr = np.random.rand(4, 30).astype(dtype)
+    indices = np.broadcast_to(np.arange(30), arr.shape)
+    np.random.seed(0)
+    out = batch_uniform_noise(arr=arr, indices=indices, upper_bound=0.2)
+    np.random.seed(0)
+    expected = batch_uniform_noise(arr=arr, indices=np.array(indices), upper_bound=0.2)
+    assert out.dtype == arr.dtype, "Test failed."
+    assert np.allclose(out, expected, atol=1e-6), "Test failed."
+
+
 @pytest.mark.perturb_func
 @pytest.mark.parametrize(
     "data,params,expected",
@@ -207,6 +207,27 @@ def test_get_random_layer_generator(load_mnist_model):
         assert layer != new_layer, "Test failed."
 
 
+@pytest.mark.pytorch_model
+@pytest.mark.parametrize(
+    "softmax,chunk_size,batch_size", [(False, 8, None), (True, 8, None), (False, 2, None), (False, 2, 3)]
+)
+def test_predict_with_parameters(load_mnist_model, softmax, chunk_size, batch_size):
+    model = PyTorchModel(load_mnist_model, channel_first=True, softmax=softmax)
+    X = np.random.random((8, 1, 28, 28)).astype(np.float32)
+
+    parameters, expected = [{}], [model.predict(X)]
+    for layer_name, random_layer_model in model.get_random_layer_generator(order="independent"):
+        parameters.append(model.state_dict_difference(random_layer_model))
+        random_model = PyTorchModel(random_layer_model, channel_first=True, softmax=softmax)
+        expected.append(random_model.predict(X))
+
+    result = model.predict_with_parameters(
+        X, parameters, chunk_size=chunk_size, batch_size=batch_size
+    )
+    assert result.shape == (len(parameters), *expected[0].shape), "Test failed."
+    assert np.allclose(result, np.stack(expected), atol=1e-5), "Test failed."
+
+
 @pytest.mark.pytorch_model
 @pytest.mark.parametrize(
     "params",
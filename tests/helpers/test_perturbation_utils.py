@@ -0,0 +1,27 @@
+import pytest
+import numpy as np
+
+from quantus.helpers.perturbation_utils import perturb_sample_batches
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize("y_shape", [(4,), (4, 3)], ids=["1d labels", "2d labels"])
+def test_perturb_sample_batches_labels(y_shape):
+    x_batch = np.random.uniform(0, 1, size=(4, 1, 8, 8))
+    a_batch = np.random.uniform(0, 1, size=(4, 1, 8, 8))
+    y_batch = np.arange(np.prod(y_shape)).reshape(y_shape)
+
+    def perturb_func(arr, indices, **kwargs):
+        return arr.copy()
+
+    for samples, x_repeated, _, y_repeated, a_repeated in perturb_sample_batches(
+        perturb_func, x_batch, y_batch, a_batch, nr_samples=5, nr_samples_per_batch=2
+    ):
+        n_samples = samples.stop - samples.start
+        # The stacked copies are sample-major, so every label stays paired with its input.
+        assert y_repeated.shape == (n_samples * len(x_batch), *y_shape[1:]), "Test failed."
+        assert np.array_equal(
+            y_repeated.reshape(n_samples, *y_shape), np.stack([y_batch] * n_samples)
+        ), "Test failed."
+        assert np.array_equal(x_repeated.reshape(n_samples, *x_batch.shape)[-1], x_batch), "Test failed."
+        assert np.array_equal(a_repeated.reshape(n_samples, *a_batch.shape)[-1], a_batch), "Test failed."
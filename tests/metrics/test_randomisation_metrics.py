@@ -1153,6 +1153,45 @@ def test_smooth_model_parameter_randomisation(
             },
             {"min": -1000000000, "max": 1000000000},
         ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {
+                "init": {
+                    "layer_order": "independent",
+                    "complexity_func": complexity_func.discrete_entropy,
+                    "similarity_func": correlation_spearman,
+                    "normalise": True,
+                    "abs": True,
+                    "disable_warnings": True,
+                    "compute_extra_scores": True,
+                    "skip_layers": False,
+                    "vectorise_model_predictions": True,
+                },
+                "call": {"explain_func": explain_func_stub},
+            },
+            {"min": -1000000000, "max": 1000000000},
+        ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {
+                "init": {
+                    "layer_order": "top_down",
+                    "complexity_func": complexity_func.discrete_entropy,
+                    "similarity_func": correlation_spearman,
+                    "normalise": True,
+                    "abs": True,
+                    "disable_warnings": True,
+                    "compute_extra_scores": True,
+                    "skip_layers": False,
+                    "vectorise_model_predictions": True,
+                    "vectorise_chunk_size": 2,
+                },
+                "call": {"explain_func": explain_func_stub, "batch_size": 4},
+            },
+            {"min": -1000000000, "max": 1000000000},
+        ),
     ],
 )
 def test_efficient_model_parameter_randomisation(
@@ -1194,7 +1233,9 @@ def test_efficient_model_parameter_randomisation(
             )
         return
 
-    scores = EfficientMPRT(**init_params)(
+    np.random.seed(42)
+    metric = EfficientMPRT(**init_params)
+    scores = metric(
         model=model,
         x_batch=x_batch,
         y_batch=y_batch,
@@ -1202,6 +1243,24 @@ def test_efficient_model_parameter_randomisation(
         **call_params,
     )
 
+    if init_params.get("vectorise_model_predictions", False):
+        # The vectorised predictions must give the same scores as predicting one model at a time.
+        np.random.seed(42)
+        metric_loop = EfficientMPRT(**{**init_params, "vectorise_model_predictions": False})
+        scores_loop = metric_loop(
+            model=model,
+            x_batch=x_batch,
+            y_batch=y_batch,
+            a_batch=a_batch,
+            **call_params,
+        )
+        assert np.allclose(scores, scores_loop, equal_nan=True), "Test failed."
+        assert list(metric.model_scores_by_layer) == list(metric_loop.model_scores_by_layer), "Test failed."
+        for layer_name, model_scores in metric.model_scores_by_layer.items():
+            assert np.allclose(
+                model_scores, metric_loop.model_scores_by_layer[layer_name], atol=1e-5, equal_nan=True
+            ), "Test failed."
+
     out_of_range_scores = [
         s for s in scores if not (expected["min"] <= s <= expected["max"])
     ]
@@ -1210,6 +1269,77 @@ def test_efficient_model_parameter_randomisation(
     ), f"Test failed. Out of range scores: {out_of_range_scores}"
 
 
+@pytest.mark.randomisation
+@pytest.mark.parametrize(
+    "rule", [None, "Freedman Diaconis", "Scotts", "Square Root", "Sturges Formula", "Rice"]
+)
+def test_efficient_model_parameter_randomisation_skip_normalise(
+    load_mnist_model, load_mnist_images, rule
+):
+    x_batch, y_batch = load_mnist_images["x_batch"], load_mnist_images["y_batch"]
+
+    # Small-magnitude attributions, for which the bin width of some n_bins rules is clamped.
+    a_batch = 1e-7 * explain(
+        model=load_mnist_model, inputs=x_batch, targets=y_batch, method="Saliency"
+    )
+
+    scores = {}
+    for skip_normalise in [True, False]:
+        metric = EfficientMPRT(
+            complexity_func=complexity_func.discrete_entropy,
+            complexity_func_kwargs={"rule": rule} if rule else {},
+            normalise=True,
+            abs=True,
+            disable_warnings=True,
+            display_progressbar=False,
+        )
+        assert metric._skip_normalise, "Test failed."
+        metric._skip_normalise = skip_normalise
+        scores[skip_normalise] = metric(
+            model=load_mnist_model,
+            x_batch=x_batch,
+            y_batch=y_batch,
+            a_batch=a_batch.copy(),
+            explain_func=explain,
+            explain_func_kwargs={"method": "Saliency"},
+        )
+    assert np.allclose(scores[True], scores[False], equal_nan=True), "Test failed."
+
+
+@pytest.mark.randomisation
+def test_efficient_model_parameter_randomisation_find_n_bins(
+    load_mnist_model, load_mnist_images
+):
+    x_batch, y_batch = load_mnist_images["x_batch"], load_mnist_images["y_batch"]
+
+    scores_orig = {}
+    # The "Square Root" rule yields the minimum of 10 bins for these inputs.
+    for complexity_func_kwargs in [{"rule": "Square Root"}, {"n_bins": 10}]:
+        metric = EfficientMPRT(
+            # A complexity function that depends on the scale of the attributions.
+            complexity_func=lambda a, x, **kwargs: float(np.abs(a).sum()),
+            complexity_func_kwargs=complexity_func_kwargs,
+            normalise=True,
+            skip_layers=True,
+            disable_warnings=True,
+            display_progressbar=False,
+        )
+        metric(
+            model=load_mnist_model,
+            x_batch=x_batch,
+            y_batch=y_batch,
+            a_batch=None,
+            explain_func=explain,
+            explain_func_kwargs={"method": "Saliency"},
+            batch_size=2,
+        )
+        assert metric.complexity_func_kwargs["n_bins"] == 10, "Test failed."
+        scores_orig[str(complexity_func_kwargs)] = metric.explanation_scores_by_layer["orig"]
+
+    # Searching for the number of bins must not change the attributions of the original model.
+    assert np.allclose(*scores_orig.values()), "Test failed."
+
+
 @pytest.mark.randomisation
 @pytest.mark.parametrize(
     "model,data,params,expected",
@@ -73,6 +73,12 @@ def predict(model: tf.keras.Model | torch.nn.Module, x_batch: np.ndarray) -> np.
             {},
             {},
         ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {"nr_samples_per_batch": 2},
+            {},
+        ),
     ],
 )
 def test_relative_input_stability(
@@ -245,3 +251,23 @@ def test_return_nan(
         explain_func=explain,
     )
     assert np.isnan(result).any(), "Test Failed"
+
+
+@pytest.mark.robustness
+@pytest.mark.parametrize(
+    "objective",
+    [
+        RIS_CONSTRUCTOR().relative_input_stability_objective,
+        ROS_CONSTRUCTOR().relative_output_stability_objective,
+        RRS_CONSTRUCTOR().relative_representation_stability_objective,
+    ],
+    ids=["RIS", "ROS", "RRS"],
+)
+def test_objective_integer_explanations(objective):
+    # Integer-valued explanations must not break the (float) division in the nominator.
+    x, xs = np.random.rand(4, 10), np.random.rand(4, 10)
+    e_x, e_xs = np.random.randint(0, 3, size=(2, 4, 1, 8, 8))
+
+    result = objective(x, xs, e_x, e_xs)
+    expected = objective(x, xs, e_x.astype(float), e_xs.astype(float))
+    assert np.allclose(result, expected), "Test Failed"
@@ -12,6 +12,7 @@ from quantus.metrics.robustness import (
     Continuity,
     LocalLipschitzEstimate,
     MaxSensitivity,
+    RelativeInputStability,
 )
 
 
@@ -37,6 +38,26 @@ from quantus.metrics.robustness import (
             },
             {"min": 0.0, "max": 1.0},
         ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {
+                "init": {
+                    "lower_bound": 0.2,
+                    "nr_samples": 10,
+                    "nr_samples_per_batch": 4,
+                    "disable_warnings": True,
+                    "display_progressbar": False,
+                },
+                "call": {
+                    "explain_func": explain,
+                    "explain_func_kwargs": {
+                        "method": "Saliency",
+                    },
+                },
+            },
+            {"min": 0.0, "max": 1.0},
+        ),
         (
             lazy_fixture("load_mnist_model"),
             lazy_fixture("load_mnist_images"),
@@ -336,6 +357,49 @@ def test_max_sensitivity(
             },
             {"min": 0.0, "max": 1.0},
         ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {
+                "a_batch_generate": False,
+                "init": {
+                    "perturb_std": 0.1,
+                    "nr_samples": 10,
+                    "nr_samples_per_batch": 4,
+                    "disable_warnings": True,
+                    "display_progressbar": False,
+                },
+                "call": {
+                    "explain_func": explain,
+                    "explain_func_kwargs": {
+                        "method": "Saliency",
+                    },
+                },
+            },
+            {"min": 0.0, "max": 1.0},
+        ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {
+                "a_batch_generate": False,
+                "init": {
+                    "perturb_std": 0.1,
+                    "nr_samples": 10,
+                    "nr_samples_per_batch": 2,
+                    "early_stop_threshold": 0.0,
+                    "disable_warnings": True,
+                    "display_progressbar": False,
+                },
+                "call": {
+                    "explain_func": explain,
+                    "explain_func_kwargs": {
+                        "method": "Saliency",
+                    },
+                },
+            },
+            {"min": 0.0, "max": 1.0},
+        ),
         (
             lazy_fixture("load_mnist_model"),
             lazy_fixture("load_mnist_images"),
@@ -397,6 +461,53 @@ def test_local_lipschitz_estimate(
         assert scores is not None, "Test failed."
 
 
+@pytest.mark.robustness
+@pytest.mark.parametrize("return_nan_when_prediction_changes", [False, True])
+def test_local_lipschitz_estimate_early_stop(
+    load_mnist_model, load_mnist_images, request, return_nan_when_prediction_changes
+):
+    x_batch, y_batch = load_mnist_images["x_batch"], load_mnist_images["y_batch"]
+    a_batch = explain(model=load_mnist_model, inputs=x_batch, targets=y_batch, method="Saliency")
+
+    if return_nan_when_prediction_changes:
+        # Instances with a changed prediction keep a NaN score and must not block the early stop.
+        request.getfixturevalue("mock_prediction_changed")
+
+    n_explain_calls = 0
+
+    def explain_counted(*args, **kwargs):
+        nonlocal n_explain_calls
+        n_explain_calls += 1
+        return explain(*args, **kwargs)
+
+    # Every estimate is non-negative, so sampling should stop after the first chunk of samples.
+    LocalLipschitzEstimate(
+        nr_samples=10,
+        nr_samples_per_batch=2,
+        early_stop_threshold=0.0,
+        return_nan_when_prediction_changes=return_nan_when_prediction_changes,
+        disable_warnings=True,
+    )(
+        model=load_mnist_model,
+        x_batch=x_batch,
+        y_batch=y_batch,
+        a_batch=a_batch,
+        explain_func=explain_counted,
+        explain_func_kwargs={"method": "Saliency"},
+        batch_size=len(x_batch),
+    )
+    assert n_explain_calls == 1, f"Test failed. Expected one explain_func call, got {n_explain_calls}."
+
+
+@pytest.mark.robustness
+@pytest.mark.parametrize(
+    "metric", [AvgSensitivity, LocalLipschitzEstimate, MaxSensitivity, RelativeInputStability]
+)
+def test_nr_samples_per_batch_must_be_positive(metric):
+    with pytest.raises(AssertionError):
+        metric(nr_samples_per_batch=0, disable_warnings=True)
+
+
 @pytest.mark.robustness
 @pytest.mark.parametrize(
     "model,data,params,expected",
@@ -572,6 +683,26 @@ def test_continuity(
             },
             {"min": 0.0, "max": 1.0},
         ),
+        (
+            lazy_fixture("load_mnist_model"),
+            lazy_fixture("load_mnist_images"),
+            {
+                "init": {
+                    "lower_bound": 0.2,
+                    "nr_samples": 10,
+                    "nr_samples_per_batch": 4,
+                    "disable_warnings": True,
+                    "display_progressbar": False,
+                },
+                "call": {
+                    "explain_func": explain,
+                    "explain_func_kwargs": {
+                        "method": "Saliency",
+                    },
+                },
+            },
+            {"min": 0.0, "max": 1.0},
+        ),
         (
             lazy_fixture("load_mnist_model"),
             lazy_fixture("load_mnist_images"),
@@ -982,3 +1113,95 @@ def test_return_nan_when_prediction_changes_continuity(load_mnist_model, load_mn
     )
     for r in result:
         assert np.isnan(r).any()
+
+
+@pytest.mark.robustness
+@pytest.mark.parametrize(
+    "metric,params",
+    [
+        (AvgSensitivity, {"lower_bound": 0.2}),
+        (MaxSensitivity, {"lower_bound": 0.2}),
+        (MaxSensitivity, {"lower_bound": 0.2, "return_nan_when_prediction_changes": True}),
+        (LocalLipschitzEstimate, {"perturb_std": 0.1}),
+        (LocalLipschitzEstimate, {"perturb_std": 0.1, "return_nan_when_prediction_changes": True}),
+        (RelativeInputStability, {}),
+    ],
+)
+def test_nr_samples_per_batch_matches_per_sample_loop(metric, params, load_mnist_model, load_mnist_images):
+    x_batch, y_batch = load_mnist_images["x_batch"], load_mnist_images["y_batch"]
+    a_batch = explain(model=load_mnist_model, inputs=x_batch, targets=y_batch, method="Saliency")
+
+    scores = {}
+    for nr_samples_per_batch in [1, 4]:
+        # The noise of a chunk of stacked samples is drawn in the same order as sample by sample.
+        np.random.seed(42)
+        scores[nr_samples_per_batch] = metric(
+            **params,
+            nr_samples=6,
+            nr_samples_per_batch=nr_samples_per_batch,
+            disable_warnings=True,
+        )(
+            model=load_mnist_model,
+            x_batch=x_batch,
+            y_batch=y_batch,
+            a_batch=a_batch,
+            explain_func=explain,
+            explain_func_kwargs={"method": "Saliency"},
+        )
+    assert np.allclose(scores[1], scores[4], atol=1e-5, equal_nan=True), "Test failed."
+
+
+@pytest.mark.robustness
+@pytest.mark.parametrize("metric", [AvgSensitivity, MaxSensitivity])
+def test_custom_norm_numerator(metric, load_mnist_model, load_mnist_images):
+    x_batch, y_batch = load_mnist_images["x_batch"], load_mnist_images["y_batch"]
+    a_batch = explain(model=load_mnist_model, inputs=x_batch, targets=y_batch, method="Saliency")
+
+    scores = {}
+    norm_numerators = {
+        "default": None,
+        # Custom norm functions may return a list instead of an array.
+        "list": lambda a: list(np.linalg.norm(a, axis=-1)),
+        # ... or a scalar, which is broadcast over the batch.
+        "scalar": lambda a: 1.0,
+    }
+    for name, norm_numerator in norm_numerators.items():
+        np.random.seed(42)
+        scores[name] = metric(
+            lower_bound=0.2,
+            nr_samples=4,
+            nr_samples_per_batch=2,
+            norm_numerator=norm_numerator,
+            disable_warnings=True,
+        )(
+            model=load_mnist_model,
+            x_batch=x_batch,
+            y_batch=y_batch,
+            a_batch=a_batch,
+            explain_func=explain,
+            explain_func_kwargs={"method": "Saliency"},
+        )
+    assert np.allclose(scores["default"], scores["list"]), "Test failed."
+    assert np.all(np.isfinite(scores["scalar"])), "Test failed."
+
+
+@pytest.mark.robustness
+def test_local_lipschitz_estimate_scalar_similarity_func(load_mnist_model, load_mnist_images):
+    x_batch, y_batch = load_mnist_images["x_batch"], load_mnist_images["y_batch"]
+    a_batch = explain(model=load_mnist_model, inputs=x_batch, targets=y_batch, method="Saliency")
+
+    # A custom similarity function may return a single value for all stacked samples.
+    scores = LocalLipschitzEstimate(
+        nr_samples=4,
+        nr_samples_per_batch=2,
+        similarity_func=lambda a, b, **kwargs: 1.0,
+        disable_warnings=True,
+    )(
+        model=load_mnist_model,
+        x_batch=x_batch,
+        y_batch=y_batch,
+        a_batch=a_batch,
+        explain_func=explain,
+        explain_func_kwargs={"method": "Saliency"},
+    )
+    assert np.allclose(scores, 1.0), "Test failed."